@@ -3,6 +3,11 @@ Configuration Module
 Provides a comprehensive configuration system with SOLID principles and DRY approach
 """
 
+import functools
+import importlib
+import logging
+from typing import Optional
+
 from .base import (
     BaseConfig,
     IConfigValidator,
@@ -17,7 +22,8 @@ from .base import (
     ConfigException,
     ConfigValidationError,
     ConfigLoadError,
-    ConfigNotFoundError
+    ConfigNotFoundError,
+    _MISSING
 )
 
 from .manager import (
@@ -30,37 +36,55 @@ from .manager import (
     config_manager
 )
 
-from .implementations import (
-    SchemaValidator,
-    TypeValidator,
-    FileLoader,
-    EnvironmentLoader,
-    JsonSerializer,
-    YamlSerializer,
-    FernetEncryption,
-    HashEncryption,
-    MemoryCache,
-    RedisCache,
-    DatabaseConfig,
-    CacheConfig,
-    SecurityConfig,
-    ConfigFactory as ImplConfigFactory
-)
+# Implementations and application configurations pull in optional heavy
+# dependencies (yaml, redis, cryptography), so they are imported on first access
+_LAZY_IMPORTS = {
+    'SchemaValidator': ('.implementations', 'SchemaValidator'),
+    'TypeValidator': ('.implementations', 'TypeValidator'),
+    'FileLoader': ('.implementations', 'FileLoader'),
+    'EnvironmentLoader': ('.implementations', 'EnvironmentLoader'),
+    'JsonSerializer': ('.implementations', 'JsonSerializer'),
+    'YamlSerializer': ('.implementations', 'YamlSerializer'),
+    'FernetEncryption': ('.implementations', 'FernetEncryption'),
+    'HashEncryption': ('.implementations', 'HashEncryption'),
+    'MemoryCache': ('.implementations', 'MemoryCache'),
+    'NamespacedCache': ('.implementations', 'NamespacedCache'),
+    'RedisCache': ('.implementations', 'RedisCache'),
+    'DatabaseConfig': ('.implementations', 'DatabaseConfig'),
+    'CacheConfig': ('.implementations', 'CacheConfig'),
+    'SecurityConfig': ('.implementations', 'SecurityConfig'),
+    'ImplConfigFactory': ('.implementations', 'ConfigFactory'),
+    'reload_env': ('.implementations', 'reload_env'),
+    'ApplicationConfig': ('.configs', 'ApplicationConfig'),
+    'ApplicationDefaults': ('.configs', 'ApplicationDefaults'),
+    'DatabaseConfiguration': ('.configs', 'DatabaseConfiguration'),
+    'CacheConfiguration': ('.configs', 'CacheConfiguration'),
+    'SecurityConfiguration': ('.configs', 'SecurityConfiguration'),
+    'LoggingConfiguration': ('.configs', 'LoggingConfiguration'),
+    'PaymentConfiguration': ('.configs', 'PaymentConfiguration'),
+    'NotificationConfiguration': ('.configs', 'NotificationConfiguration'),
+    'PPOBConfiguration': ('.configs', 'PPOBConfiguration'),
+    'MonitoringConfiguration': ('.configs', 'MonitoringConfiguration'),
+    'RateLimitConfiguration': ('.configs', 'RateLimitConfiguration'),
+    'TaskConfiguration': ('.configs', 'TaskConfiguration'),
+    'AppConfigFactory': ('.configs', 'AppConfigFactory'),
+    'LazyConfigRegistry': ('.configs', 'LazyConfigRegistry'),
+}
 
-from .configs import (
-    ApplicationConfig,
-    DatabaseConfiguration,
-    CacheConfiguration,
-    SecurityConfiguration,
-    LoggingConfiguration,
-    PaymentConfiguration,
-    NotificationConfiguration,
-    PPOBConfiguration,
-    MonitoringConfiguration,
-    RateLimitConfiguration,
-    TaskConfiguration,
-    AppConfigFactory
-)
+def __getattr__(name: str):
+    """Resolve lazily imported exports on first access"""
+    if name in _LAZY_IMPORTS:
+        module_name, attr = _LAZY_IMPORTS[name]
+        value = getattr(importlib.import_module(module_name, __name__), attr)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    """Include lazily imported exports in dir()"""
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
+_logger = logging.getLogger(__name__)
 
 # Version information
 __version__ = "2.0.0"
@@ -108,7 +132,9 @@ __all__ = [
     'FernetEncryption',
     'HashEncryption',
     'MemoryCache',
+    'NamespacedCache',
     'RedisCache',
+    'reload_env',
     
     # Configuration templates
     'DatabaseConfig',
@@ -117,6 +143,7 @@ __all__ = [
     
     # Application configurations
     'ApplicationConfig',
+    'ApplicationDefaults',
     'DatabaseConfiguration',
     'CacheConfiguration',
     'SecurityConfiguration',
@@ -130,6 +157,7 @@ __all__ = [
     
     # Factories
     'AppConfigFactory',
+    'LazyConfigRegistry',
     'ImplConfigFactory'
 ]
 
@@ -155,22 +183,24 @@ def initialize_configs(config_dir: str = "config", environment: str = "developme
         'staging': ConfigEnvironment.STAGING,
         'production': ConfigEnvironment.PRODUCTION
     }
-    config_manager.set_environment(env_map.get(environment, ConfigEnvironment.DEVELOPMENT))
+    target_environment = env_map.get(environment, ConfigEnvironment.DEVELOPMENT)
     
-    # Create and register all configurations
-    configs = AppConfigFactory.create_with_loaders(config_dir)
-    
-    for name, config in configs.items():
-        # Load default values first using the existing load method
-        config.load()
-        config_manager.register_config(name, config, auto_load=False)
-    
-    # Load environment-specific configurations
-    try:
-        config_manager.load_environment_configs(config_dir)
-    except Exception as e:
-        import logging
-        logging.getLogger(__name__).warning(f"Failed to load environment configs: {e}")
+    # The base config set is built once per config_dir; re-initializing resets
+    # it to the values it was built with, then applies the environment overlay
+    if config_manager.reset_to_base(config_dir):
+        try:
+            config_manager.switch_environment(target_environment, config_dir)
+        except Exception as e:
+            _logger.warning(f"Failed to load environment configs: {e}")
+    else:
+        config_manager.set_environment(target_environment)
+        _build_base_configs(config_dir)
+        
+        # Load environment-specific configurations
+        try:
+            config_manager.load_environment_configs(config_dir)
+        except Exception as e:
+            _logger.warning(f"Failed to load environment configs: {e}")
     
     # Validate all configurations after loading defaults and environment configs
     validation_errors = []
@@ -179,11 +209,34 @@ def initialize_configs(config_dir: str = "config", environment: str = "developme
             validation_errors.extend([f"Config '{name}': {error}" for error in config.get_validation_errors()])
     
     if validation_errors:
-        import logging
-        logger = logging.getLogger(__name__)
-        logger.warning(f"Configuration validation warnings: {validation_errors}")
+        _logger.warning(f"Configuration validation warnings: {validation_errors}")
         # Don't raise exception for missing optional configs, just log warnings
 
+def _build_base_configs(config_dir: str) -> None:
+    """Create, load and register every application configuration"""
+    from .configs import AppConfigFactory
+    configs = AppConfigFactory.create_with_loaders(config_dir)
+    
+    # Load default values first
+    for config in configs.values():
+        config.load()
+    
+    config_manager.set_base_configs(configs, config_dir)
+
+# (key, default) pairs read from the 'logging' config by setup_logging_from_config
+_LOGGING_DEFAULTS = (
+    ('disable_existing_loggers', False),
+    ('format', '%(asctime)s - %(name)s - %(levelname)s - %(message)s'),
+    ('date_format', '%Y-%m-%d %H:%M:%S'),
+    ('level', 'INFO'),
+    ('handlers', ['console']),
+    ('console_handler', {}),
+    ('file_handler', {}),
+    ('loggers', {}),
+)
+
+_DETAILED_LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(module)s - %(funcName)s - %(message)s'
+
 def setup_logging_from_config() -> None:
     """Setup logging from configuration"""
     try:
@@ -191,31 +244,35 @@ def setup_logging_from_config() -> None:
         
         import logging.config
         
+        # Fetch every value once up front instead of per use
+        vals = {key: logging_config.get(key, default) for key, default in _LOGGING_DEFAULTS}
+        handlers = vals['handlers']
+        
         # Convert config to logging dict config
         log_config = {
             'version': 1,
-            'disable_existing_loggers': logging_config.get('disable_existing_loggers', False),
+            'disable_existing_loggers': vals['disable_existing_loggers'],
             'formatters': {
                 'default': {
-                    'format': logging_config.get('format', '%(asctime)s - %(name)s - %(levelname)s - %(message)s'),
-                    'datefmt': logging_config.get('date_format', '%Y-%m-%d %H:%M:%S')
+                    'format': vals['format'],
+                    'datefmt': vals['date_format']
                 },
                 'detailed': {
-                    'format': '%(asctime)s - %(name)s - %(levelname)s - %(module)s - %(funcName)s - %(message)s',
-                    'datefmt': logging_config.get('date_format', '%Y-%m-%d %H:%M:%S')
+                    'format': _DETAILED_LOG_FORMAT,
+                    'datefmt': vals['date_format']
                 }
             },
             'handlers': {},
             'loggers': {},
             'root': {
-                'level': logging_config.get('level', 'INFO'),
-                'handlers': logging_config.get('handlers', ['console'])
+                'level': vals['level'],
+                'handlers': handlers
             }
         }
         
         # Add console handler
-        if 'console' in logging_config.get('handlers', []):
-            console_config = logging_config.get('console_handler', {})
+        if 'console' in handlers:
+            console_config = vals['console_handler']
             log_config['handlers']['console'] = {
                 'class': console_config.get('class', 'logging.StreamHandler'),
                 'level': console_config.get('level', 'INFO'),
@@ -223,8 +280,8 @@ def setup_logging_from_config() -> None:
             }
         
         # Add file handler
-        if 'file' in logging_config.get('handlers', []):
-            file_config = logging_config.get('file_handler', {})
+        if 'file' in handlers:
+            file_config = vals['file_handler']
             log_config['handlers']['file'] = {
                 'class': file_config.get('class', 'logging.handlers.RotatingFileHandler'),
                 'level': file_config.get('level', 'DEBUG'),
@@ -235,7 +292,7 @@ def setup_logging_from_config() -> None:
             }
         
         # Add custom loggers
-        for logger_name, logger_config in logging_config.get('loggers', {}).items():
+        for logger_name, logger_config in vals['loggers'].items():
             log_config['loggers'][logger_name] = {
                 'level': logger_config.get('level', 'INFO'),
                 'handlers': logger_config.get('handlers', []),
@@ -245,8 +302,7 @@ def setup_logging_from_config() -> None:
         logging.config.dictConfig(log_config)
         
     except Exception as e:
-        import logging
-        logging.getLogger(__name__).error(f"Failed to setup logging from config: {e}")
+        _logger.error(f"Failed to setup logging from config: {e}")
 
 def create_config_builder(config_class: type) -> ConfigBuilder:
     """Create configuration builder"""
@@ -280,9 +336,10 @@ def import_configs(filepath: str, format: str = 'json') -> None:
 def config_required(config_name: str, key: str):
     """Decorator to ensure configuration value is available"""
     def decorator(func):
+        @functools.wraps(func)
         def wrapper(*args, **kwargs):
             try:
-                value = get_config_value(config_name, key)
+                value = config_manager.get_config(config_name).get(key)
                 if value is None:
                     raise ConfigException(f"Required configuration '{config_name}.{key}' not found")
                 return func(*args, **kwargs)
@@ -294,10 +351,10 @@ def config_required(config_name: str, key: str):
 def with_config(config_name: str):
     """Decorator to inject configuration into function"""
     def decorator(func):
+        @functools.wraps(func)
         def wrapper(*args, **kwargs):
             try:
-                config = get_config(config_name)
-                kwargs['config'] = config
+                kwargs['config'] = config_manager.get_config(config_name)
                 return func(*args, **kwargs)
             except Exception as e:
                 raise ConfigException(f"Failed to inject config '{config_name}': {e}")
@@ -312,27 +369,28 @@ class ConfigContext:
         self.config_name = config_name
         self.changes = changes
         self.original_values = {}
+        self._config: Optional[BaseConfig] = None
     
     def __enter__(self):
-        config = get_config(self.config_name)
+        config = self._config = get_config(self.config_name)
         
         # Store original values
         for key in self.changes:
-            if config.has_key(key):
-                self.original_values[key] = config.get(key)
+            value = config.get(key, _MISSING)
+            if value is not _MISSING:
+                self.original_values[key] = value
         
         # Apply changes
-        for key, value in self.changes.items():
-            config.set(key, value)
+        config.update(self.changes)
         
         return config
     
     def __exit__(self, exc_type, exc_val, exc_tb):
-        config = get_config(self.config_name)
+        config = self._config
+        self._config = None
         
         # Restore original values
-        for key, value in self.original_values.items():
-            config.set(key, value)
+        config.update(self.original_values)
         
         # Remove keys that didn't exist originally
         for key in self.changes:
@@ -344,6 +402,4 @@ def config_context(config_name: str, **changes):
     return ConfigContext(config_name, **changes)
 
 # Module initialization
-import logging
-_logger = logging.getLogger(__name__)
 _logger.info(f"Configuration module initialized (version {__version__})")
@@ -4,17 +4,44 @@ Implements SOLID principles with comprehensive interfaces and abstractions
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional, List, Union, Type, Generic, TypeVar
+from typing import Any, ClassVar, Dict, Iterable, Optional, List, Tuple, Union, Type, Generic, TypeVar
 from enum import Enum
 from dataclasses import dataclass
 from pathlib import Path
+from collections import deque
+import copy
+from functools import lru_cache
 import logging
+import re
+import sys
+import time
+import weakref
 from datetime import datetime
 
 # Type definitions
 T = TypeVar('T')
 ConfigValue = Union[str, int, float, bool, Dict, List]
 
+# Sentinel for lookups where None is a legitimate value
+_MISSING = object()
+
+# Validator -> {config class: whether its class-level _DEFAULTS pass}; each
+# pair is checked once per process rather than on every load
+_VALIDATED_DEFAULTS: "weakref.WeakKeyDictionary[Any, Dict[type, bool]]" = weakref.WeakKeyDictionary()
+
+@lru_cache(maxsize=4096)
+def _split_key(key: str) -> tuple:
+    """Split a dotted configuration key into its path segments"""
+    return tuple(sys.intern(part) for part in key.split('.'))
+
+# Key fragments that mark a value as sensitive
+_SENSITIVE_RE = re.compile(r'password|secret|key|token|credential', re.IGNORECASE)
+
+@lru_cache(maxsize=4096)
+def _is_sensitive_key(key: str) -> bool:
+    """Check if key names a sensitive value"""
+    return _SENSITIVE_RE.search(key) is not None
+
 class ConfigSource(Enum):
     """Configuration source types"""
     ENVIRONMENT = "environment"
@@ -30,16 +57,53 @@ class ConfigPriority(Enum):
     HIGH = 3
     CRITICAL = 4
 
-@dataclass
+def _datetime_to_ns(value: datetime) -> int:
+    """Convert a datetime to nanoseconds since the epoch"""
+    return int(value.timestamp()) * 1_000_000_000 + value.microsecond * 1000
+
+@dataclass(slots=True, frozen=True)
 class ConfigMetadata:
-    """Configuration metadata"""
+    """Configuration metadata
+    
+    Timestamps are stored as nanoseconds since the epoch (``time.time_ns()``)
+    and only converted to ``datetime`` on demand.
+    """
     source: ConfigSource
     priority: ConfigPriority
-    created_at: datetime
-    updated_at: Optional[datetime] = None
+    created_at: int
+    updated_at: Optional[int] = None
     version: str = "1.0.0"
     encrypted: bool = False
     cached: bool = False
+    
+    @property
+    def created_at_dt(self) -> datetime:
+        """Creation time as datetime"""
+        return datetime.fromtimestamp(self.created_at / 1_000_000_000)
+    
+    @property
+    def updated_at_dt(self) -> Optional[datetime]:
+        """Last update time as datetime"""
+        if self.updated_at is None:
+            return None
+        return datetime.fromtimestamp(self.updated_at / 1_000_000_000)
+
+@lru_cache(maxsize=256)
+def _shared_metadata(
+    source: ConfigSource,
+    priority: ConfigPriority,
+    created_at: int,
+    updated_at: Optional[int] = None,
+    version: str = "1.0.0",
+    encrypted: bool = False,
+    cached: bool = False
+) -> ConfigMetadata:
+    """Return a shared ConfigMetadata instance for the given field values"""
+    return ConfigMetadata(source, priority, created_at, updated_at, version, encrypted, cached)
+
+def _coarse_time_ns() -> int:
+    """Current time truncated to milliseconds, so writes in the same millisecond share metadata"""
+    return time.time_ns() // 1_000_000 * 1_000_000
 
 class IConfigValidator(ABC):
     """Interface for configuration validators"""
@@ -53,6 +117,14 @@ class IConfigValidator(ABC):
     def get_validation_errors(self) -> List[str]:
         """Get validation errors"""
         pass
+    
+    def validate_batch(self, data: Dict[str, Any]) -> List[str]:
+        """Validate all values in data, returning errors prefixed with their key"""
+        errors = []
+        for key, value in data.items():
+            if not self.validate(key, value):
+                errors.extend(f"Key '{key}': {error}" for error in self.get_validation_errors())
+        return errors
 
 class IConfigLoader(ABC):
     """Interface for configuration loaders"""
@@ -92,6 +164,10 @@ class IConfigEncryption(ABC):
     def decrypt(self, encrypted_value: str) -> str:
         """Decrypt configuration value"""
         pass
+    
+    def encrypt_many(self, values: Iterable[str]) -> List[str]:
+        """Encrypt several values; implementations may batch the work"""
+        return [self.encrypt(value) for value in values]
 
 class IConfigCache(ABC):
     """Interface for configuration caching"""
@@ -123,6 +199,10 @@ class IConfigObserver(ABC):
     def on_config_changed(self, key: str, old_value: Any, new_value: Any) -> None:
         """Handle configuration change event"""
         pass
+    
+    def on_configs_restored(self, config_names: List[str]) -> None:
+        """Handle a bulk restore; called once after all named configs were replaced"""
+        pass
 
 class ConfigException(Exception):
     """Base configuration exception"""
@@ -151,6 +231,12 @@ class BaseConfig(ABC):
     Dependency Inversion: Depends on abstractions
     """
     
+    __slots__ = (
+        '_data', '_metadata', '_observers', '_validated_values', '_version', '_snapshot',
+        '_validator', '_loader', '_serializer', '_encryption', '_cache', '_logger',
+        '_loaded', '_validated', '_readonly', '_validation_errors', '__weakref__'
+    )
+    
     def __init__(
         self,
         validator: Optional[IConfigValidator] = None,
@@ -162,7 +248,13 @@ class BaseConfig(ABC):
     ):
         self._data: Dict[str, Any] = {}
         self._metadata: Dict[str, ConfigMetadata] = {}
-        self._observers: List[IConfigObserver] = []
+        # Immutable snapshot, rebuilt on add/remove so notification never copies
+        self._observers: Tuple[IConfigObserver, ...] = ()
+        # Top-level values that last passed the validator, keyed by key
+        self._validated_values: Dict[str, Any] = {}
+        # Bumped on every mutation; backup() reuses its snapshot while unchanged
+        self._version = 0
+        self._snapshot: Optional[Tuple[int, Dict[str, Any], Dict[str, Any]]] = None
         
         # Dependency injection
         self._validator = validator
@@ -177,21 +269,33 @@ class BaseConfig(ABC):
         self._validated = False
         self._readonly = False
     
-    # Core abstract methods
-    @abstractmethod
+    # Subclasses declare their name and required keys as class constants
+    CONFIG_NAME: ClassVar[str] = ''
+    REQUIRED_KEYS: ClassVar[Tuple[str, ...]] = ()
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # A config without a name would silently register under ''
+        if not cls.CONFIG_NAME and cls.get_config_name is BaseConfig.get_config_name:
+            raise TypeError(f"{cls.__name__} must define a non-empty CONFIG_NAME or override get_config_name()")
+    
+    # Core methods
     def get_config_name(self) -> str:
         """Get configuration name"""
-        pass
+        return self.CONFIG_NAME
     
     @abstractmethod
     def get_default_values(self) -> Dict[str, Any]:
-        """Get default configuration values"""
+        """Get default configuration values
+        
+        Implementations may return a shared class-level dict; callers must not
+        mutate it.
+        """
         pass
     
-    @abstractmethod
-    def get_required_keys(self) -> List[str]:
+    def get_required_keys(self) -> Tuple[str, ...]:
         """Get required configuration keys"""
-        pass
+        return self.REQUIRED_KEYS
     
     # Configuration management
     def get(self, key: str, default: Any = None) -> Any:
@@ -203,8 +307,10 @@ class BaseConfig(ABC):
                 if cached_value is not None:
                     return cached_value
             
-            # Get from data
-            value = self._get_nested_value(key, default)
+            # Get from data; missing keys return the default without caching it
+            value = self._get_nested_value(key, _MISSING)
+            if value is _MISSING:
+                return default
             
             # Decrypt if needed
             if self._is_encrypted(key) and self._encryption:
@@ -220,19 +326,26 @@ class BaseConfig(ABC):
             self._logger.error(f"Error getting config key '{key}': {e}")
             return default
     
+    def get_many(self, keys: Tuple[str, ...], default: Any = None) -> Tuple[Any, ...]:
+        """Get several configuration values in one call"""
+        get = self.get
+        return tuple([get(key, default) for key in keys])
+    
     def set(self, key: str, value: Any, metadata: Optional[ConfigMetadata] = None) -> None:
         """Set configuration value with validation and encryption"""
         if self._readonly:
             raise ConfigException(f"Configuration is readonly, cannot set '{key}'")
         
+        key = sys.intern(key)
+        
         try:
             # Validate value
             if self._validator and not self._validator.validate(key, value):
                 errors = self._validator.get_validation_errors()
                 raise ConfigValidationError(f"Validation failed for '{key}': {errors}")
             
-            # Get old value for observers
-            old_value = self.get(key)
+            # Get old value for observers straight from storage (no cache/decrypt round-trip)
+            old_value = self._get_nested_value(key)
             
             # Encrypt if needed
             if self._should_encrypt(key) and self._encryption:
@@ -240,23 +353,24 @@ class BaseConfig(ABC):
             
             # Set value
             self._set_nested_value(key, value)
+            self._validated_values.pop(_split_key(key)[0], None)
+            self._version += 1
             
             # Set metadata
             if metadata:
                 self._metadata[key] = metadata
             else:
-                self._metadata[key] = ConfigMetadata(
-                    source=ConfigSource.MEMORY,
-                    priority=ConfigPriority.MEDIUM,
-                    created_at=datetime.now()
+                self._metadata[key] = _shared_metadata(
+                    ConfigSource.MEMORY, ConfigPriority.MEDIUM, _coarse_time_ns()
                 )
             
             # Invalidate cache
             if self._cache:
                 self._cache.invalidate(key)
             
-            # Notify observers
-            self._notify_observers(key, old_value, value)
+            # Notify observers, skipping no-op writes
+            if old_value != value:
+                self._notify_observers(key, old_value, value)
             
             self._logger.debug(f"Set config key '{key}' with value type: {type(value)}")
             
@@ -264,18 +378,19 @@ class BaseConfig(ABC):
             self._logger.error(f"Error setting config key '{key}': {e}")
             raise
     
+    def update(self, values: Dict[str, Any]) -> None:
+        """Set multiple configuration values"""
+        if self._readonly:
+            raise ConfigException("Configuration is readonly")
+        
+        for key, value in values.items():
+            self.set(key, value)
+    
     def load_defaults(self) -> None:
         """Load only default configuration values"""
         try:
             defaults = self.get_default_values()
-            for key, value in defaults.items():
-                if key not in self._data:
-                    self._data[key] = value
-                    self._metadata[key] = ConfigMetadata(
-                        source=ConfigSource.MEMORY,
-                        priority=ConfigPriority.LOW,
-                        created_at=datetime.now()
-                    )
+            self._bulk_load(defaults, prevalidated=self._defaults_prevalidated(defaults))
             
             self._loaded = True
             self._logger.debug(f"Default values loaded for '{self.get_config_name()}'")
@@ -291,15 +406,17 @@ class BaseConfig(ABC):
                 data = self._loader.load(source)
                 self._merge_data(data)
             
-            # Load defaults for missing keys
+            # Load defaults for missing keys; class defaults are validated once per
+            # class, anything else (or defaults that failed) is checked here
             defaults = self.get_default_values()
-            for key, value in defaults.items():
-                if key not in self._data:
-                    self.set(key, value, ConfigMetadata(
-                        source=ConfigSource.MEMORY,
-                        priority=ConfigPriority.LOW,
-                        created_at=datetime.now()
-                    ))
+            prevalidated = self._defaults_prevalidated(defaults)
+            if self._validator and not prevalidated:
+                errors = self._validator.validate_batch(
+                    {key: value for key, value in defaults.items() if key not in self._data}
+                )
+                if errors:
+                    raise ConfigValidationError(f"Validation failed for default values: {errors}")
+            self._bulk_load(defaults, prevalidated=prevalidated, encrypt=True)
             
             self._loaded = True
             self._logger.info(f"Configuration '{self.get_config_name()}' loaded successfully")
@@ -308,6 +425,78 @@ class BaseConfig(ABC):
             self._logger.error(f"Error loading configuration: {e}")
             raise ConfigLoadError(f"Failed to load configuration: {e}")
     
+    def _bulk_load(
+        self,
+        items: Dict[str, Any],
+        source: ConfigSource = ConfigSource.MEMORY,
+        priority: ConfigPriority = ConfigPriority.LOW,
+        prevalidated: bool = False,
+        encrypt: bool = False
+    ) -> None:
+        """Insert values for keys that are not set yet, bypassing per-key set() overhead
+        
+        With prevalidated, the inserted values are recorded as already having
+        passed the validator so the next validate() skips them. With encrypt,
+        sensitive keys are stored encrypted when an encryption backend is set.
+        """
+        # Mutable values are copied so the config never aliases shared default dicts
+        missing = {
+            sys.intern(key): copy.deepcopy(value) if isinstance(value, (dict, list)) else value
+            for key, value in items.items() if key not in self._data
+        }
+        if not missing:
+            return
+        
+        sensitive: List[str] = []
+        if encrypt and self._encryption:
+            sensitive = [key for key in missing if self._should_encrypt(key)]
+            if sensitive:
+                encrypted = self._encryption.encrypt_many([str(missing[key]) for key in sensitive])
+                missing.update(zip(sensitive, encrypted))
+        
+        # Only plaintext values are the ones the validator actually passed
+        if prevalidated:
+            if sensitive:
+                self._validated_values.update(
+                    (key, value) for key, value in missing.items() if key not in sensitive
+                )
+            else:
+                self._validated_values.update(missing)
+        
+        self._data.update(missing)
+        self._version += 1
+        
+        # All keys loaded in one batch share a single metadata record per encryption state
+        created_at = _coarse_time_ns()
+        self._metadata.update(dict.fromkeys(missing, _shared_metadata(source, priority, created_at)))
+        if sensitive:
+            self._metadata.update(dict.fromkeys(
+                sensitive, _shared_metadata(source, priority, created_at, encrypted=True)
+            ))
+        
+        if self._cache:
+            self._cache.clear()
+        
+        if self._observers:
+            for key, value in missing.items():
+                self._notify_observers(key, None, value)
+    
+    def _defaults_prevalidated(self, defaults: Dict[str, Any]) -> bool:
+        """Check whether shared class-level defaults already passed this config's validator"""
+        validator = self._validator
+        if validator is None or defaults is not getattr(type(self), '_DEFAULTS', None):
+            return False
+        
+        try:
+            results = _VALIDATED_DEFAULTS.setdefault(validator, {})
+        except TypeError:
+            return False
+        
+        passed = results.get(type(self))
+        if passed is None:
+            passed = results[type(self)] = not validator.validate_batch(defaults)
+        return passed
+    
     def validate(self) -> bool:
         """Validate entire configuration"""
         self._validation_errors = []
@@ -320,12 +509,19 @@ class BaseConfig(ABC):
             if missing_keys:
                 self._validation_errors.append(f"Missing required keys: {missing_keys}")
             
-            # Validate with validator if available
+            # Validate with validator if available, skipping values unchanged since the last pass
             if self._validator:
-                for key, value in self._data.items():
-                    if not self._validator.validate(key, value):
-                        errors = self._validator.get_validation_errors()
-                        self._validation_errors.extend([f"Key '{key}': {error}" for error in errors])
+                validated = self._validated_values
+                pending = {
+                    key: value for key, value in self._data.items()
+                    if validated.get(key, _MISSING) is not value
+                }
+                if pending:
+                    errors = self._validator.validate_batch(pending)
+                    if errors:
+                        self._validation_errors.extend(errors)
+                    else:
+                        validated.update(pending)
             
             if not self._validation_errors:
                 self._validated = True
@@ -351,52 +547,74 @@ class BaseConfig(ABC):
         """Reload configuration"""
         self._loaded = False
         self._validated = False
+        self._validated_values.clear()
         if self._cache:
             self._cache.clear()
         self.load()
         self.validate()
     
     def backup(self) -> Dict[str, Any]:
-        """Create configuration backup"""
-        return {
-            'data': self._data.copy(),
-            'metadata': {k: {
+        """Create configuration backup
+        
+        The returned snapshot is shared between calls until the configuration
+        changes, so callers must treat it as read-only; use backup_deep() for
+        an isolated copy.
+        """
+        snapshot = self._snapshot
+        if snapshot is None or snapshot[0] != self._version:
+            snapshot = self._snapshot = (self._version, self._data.copy(), {k: {
                 'source': v.source.value,
                 'priority': v.priority.value,
-                'created_at': v.created_at.isoformat(),
-                'updated_at': v.updated_at.isoformat() if v.updated_at else None,
+                'created_at': v.created_at_dt.isoformat(),
+                'updated_at': v.updated_at_dt.isoformat() if v.updated_at else None,
                 'version': v.version,
                 'encrypted': v.encrypted,
                 'cached': v.cached
-            } for k, v in self._metadata.items()}
+            } for k, v in self._metadata.items()})
+        
+        return {
+            'data': snapshot[1],
+            'metadata': snapshot[2],
+            'version': snapshot[0]
         }
     
+    def backup_deep(self) -> Dict[str, Any]:
+        """Create configuration backup that shares no state with the configuration"""
+        return copy.deepcopy(self.backup())
+    
     def restore(self, backup: Dict[str, Any]) -> None:
         """Restore configuration from backup"""
         if 'data' in backup:
             self._data = backup['data'].copy()
+            self._validated_values.clear()
         
         if 'metadata' in backup:
             self._metadata = {}
             for key, meta in backup['metadata'].items():
-                self._metadata[key] = ConfigMetadata(
+                self._metadata[key] = _shared_metadata(
                     source=ConfigSource(meta['source']),
                     priority=ConfigPriority(meta['priority']),
-                    created_at=datetime.fromisoformat(meta['created_at']),
-                    updated_at=datetime.fromisoformat(meta['updated_at']) if meta['updated_at'] else None,
+                    created_at=_datetime_to_ns(datetime.fromisoformat(meta['created_at'])),
+                    updated_at=_datetime_to_ns(datetime.fromisoformat(meta['updated_at'])) if meta['updated_at'] else None,
                     version=meta['version'],
                     encrypted=meta['encrypted'],
                     cached=meta['cached']
                 )
+        
+        if self._cache:
+            self._cache.clear()
+        self._version += 1
     
     def add_observer(self, observer: IConfigObserver) -> None:
         """Add configuration change observer"""
-        self._observers.append(observer)
+        self._observers += (observer,)
     
     def remove_observer(self, observer: IConfigObserver) -> None:
         """Remove configuration change observer"""
         if observer in self._observers:
-            self._observers.remove(observer)
+            observers = list(self._observers)
+            observers.remove(observer)
+            self._observers = tuple(observers)
     
     def set_readonly(self, readonly: bool = True) -> None:
         """Set configuration as readonly"""
@@ -430,6 +648,8 @@ class BaseConfig(ABC):
         if key in self._data:
             old_value = self._data[key]
             del self._data[key]
+            self._validated_values.pop(key, None)
+            self._version += 1
             
             if key in self._metadata:
                 del self._metadata[key]
@@ -442,39 +662,50 @@ class BaseConfig(ABC):
     # Helper methods
     def _get_nested_value(self, key: str, default: Any = None) -> Any:
         """Get nested configuration value using dot notation"""
-        keys = key.split('.')
-        value = self._data
+        # Flat keys are the common case
+        if '.' not in key:
+            return self._data.get(key, default)
         
-        for k in keys:
-            if isinstance(value, dict) and k in value:
+        # Walk the live nested data; a missing segment or a non-container value
+        # on the way raises, which costs less than checking every step up front
+        value = self._data
+        try:
+            for k in _split_key(key):
                 value = value[k]
-            else:
-                return default
+        except (LookupError, TypeError):
+            return default
         
         return value
     
     def _set_nested_value(self, key: str, value: Any) -> None:
         """Set nested configuration value using dot notation"""
-        keys = key.split('.')
+        if '.' not in key:
+            self._data[key] = value
+            return
+        
+        keys = _split_key(key)
         data = self._data
         
         for k in keys[:-1]:
-            if k not in data:
-                data[k] = {}
-            data = data[k]
+            data = data.setdefault(k, {})
         
         data[keys[-1]] = value
     
     def _merge_data(self, new_data: Dict[str, Any]) -> None:
         """Merge new data with existing configuration"""
-        def merge_dict(target: Dict, source: Dict) -> None:
+        # Iterative merge keeps deep configs clear of the recursion limit
+        pending = deque([(self._data, new_data)])
+        while pending:
+            target, source = pending.popleft()
             for key, value in source.items():
-                if key in target and isinstance(target[key], dict) and isinstance(value, dict):
-                    merge_dict(target[key], value)
+                current = target.get(key)
+                if isinstance(current, dict) and isinstance(value, dict):
+                    pending.append((current, value))
                 else:
-                    target[key] = value
+                    target[sys.intern(key) if isinstance(key, str) else key] = value
         
-        merge_dict(self._data, new_data)
+        self._validated_values.clear()
+        self._version += 1
     
     def _is_encrypted(self, key: str) -> bool:
         """Check if key should be encrypted"""
@@ -483,11 +714,13 @@ class BaseConfig(ABC):
     
     def _should_encrypt(self, key: str) -> bool:
         """Check if key should be encrypted based on naming convention"""
-        sensitive_patterns = ['password', 'secret', 'key', 'token', 'credential']
-        return any(pattern in key.lower() for pattern in sensitive_patterns)
+        return _is_sensitive_key(key)
     
     def _notify_observers(self, key: str, old_value: Any, new_value: Any) -> None:
         """Notify configuration change observers"""
+        if not self._observers or old_value is new_value:
+            return
+        
         for observer in self._observers:
             try:
                 observer.on_config_changed(key, old_value, new_value)
@@ -0,0 +1,54 @@
+"""
+Specialized Configuration Getters
+Generates pre-bound accessor functions for fixed (section, key) pairs
+"""
+
+import keyword
+import logging
+import types
+from functools import partial
+from typing import Mapping
+
+from .base import BaseConfig
+
+_logger = logging.getLogger(__name__)
+
+def _getter_name(section: str, key: str) -> str:
+    return f"get_{section}_{key}"
+
+def _is_bindable(key: str) -> bool:
+    """Only identifier-safe top-level keys get a getter"""
+    return isinstance(key, str) and key.isidentifier() and not keyword.iskeyword(key)
+
+def build(configs: Mapping[str, BaseConfig], module_name: str = 'config.specialized') -> types.ModuleType:
+    """
+    Build a module of getters such as ``get_rate_limit_enabled()``
+    
+    Each getter is BaseConfig.get pre-bound to its config and key, so it skips
+    the manager lookup while keeping decryption, the config cache and the
+    usual default handling. Rebuild after configs are re-registered.
+    
+    Pairs that map to the same getter name (``rate``/``limit_enabled`` and
+    ``rate_limit``/``enabled``) keep the first one and log a warning.
+    """
+    module = types.ModuleType(module_name)
+    namespace = module.__dict__
+    emitted = {}
+    
+    for section, config in configs.items():
+        if not section.isidentifier():
+            continue
+        for key in config.get_all_keys():
+            if not _is_bindable(key):
+                continue
+            name = _getter_name(section, key)
+            if name in emitted:
+                _logger.warning(
+                    "Skipping getter %s for %s.%s: name already used by %s.%s",
+                    name, section, key, *emitted[name]
+                )
+                continue
+            emitted[name] = (section, key)
+            namespace[name] = partial(config.get, key)
+    
+    return module
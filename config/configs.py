@@ -3,546 +3,633 @@ Concrete Configuration Classes
 Application-specific configuration implementations
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, ClassVar, Tuple, Callable, Iterator
+from collections.abc import Mapping
+from dataclasses import dataclass, field, asdict
+from functools import lru_cache
 import os
+import secrets
 from pathlib import Path
 import logging
 
 from .base import BaseConfig, ConfigMetadata, ConfigSource, ConfigPriority
+from .manager import config_manager, ConfigEnvironment
 from .implementations import (
-    SchemaValidator, FileLoader, EnvironmentLoader, MemoryCache,
-    DatabaseConfig, CacheConfig, SecurityConfig
+    SchemaValidator, MemoryCache, _shared_file_loader,
+    DatabaseConfig, CacheConfig, SecurityConfig, _intern_keys
 )
 
+@dataclass(slots=True, frozen=True)
+class ApplicationDefaults:
+    """Typed application defaults with attribute access"""
+    app_name: str = 'Digital Product & PPOB Platform API'
+    app_version: str = '1.0.0'
+    debug: bool = False
+    environment: str = 'production'
+    host: str = '0.0.0.0'
+    port: int = 8000
+    workers: int = 4
+    max_request_size: int = 16 * 1024 * 1024  # 16MB
+    request_timeout: int = 30
+    cors_enabled: bool = True
+    cors_origins: List[str] = field(default_factory=lambda: ['*'])
+    cors_methods: List[str] = field(default_factory=lambda: ['GET', 'POST', 'PUT', 'DELETE', 'OPTIONS'])
+    cors_headers: List[str] = field(default_factory=lambda: ['*'])
+    api_prefix: str = '/api/v1'
+    docs_url: str = '/docs'
+    redoc_url: str = '/redoc'
+    openapi_url: str = '/openapi.json'
+    timezone: str = 'UTC'
+    locale: str = 'en_US'
+    pagination_default_limit: int = 20
+    pagination_max_limit: int = 100
+
 class ApplicationConfig(BaseConfig):
     """Main application configuration"""
     
-    def get_config_name(self) -> str:
-        return "application"
+    __slots__ = ()
+    CONFIG_NAME: ClassVar[str] = "application"
+    REQUIRED_KEYS: ClassVar[Tuple[str, ...]] = ('app_name', 'host', 'port')
     
-    def get_default_values(self) -> Dict[str, Any]:
-        return {
-            'app_name': 'Digital Product & PPOB Platform API',
-            'app_version': '1.0.0',
-            'debug': False,
-            'environment': 'production',
-            'host': '0.0.0.0',
-            'port': 8000,
-            'workers': 4,
-            'max_request_size': 16 * 1024 * 1024,  # 16MB
-            'request_timeout': 30,
-            'cors_enabled': True,
-            'cors_origins': ['*'],
-            'cors_methods': ['GET', 'POST', 'PUT', 'DELETE', 'OPTIONS'],
-            'cors_headers': ['*'],
-            'api_prefix': '/api/v1',
-            'docs_url': '/docs',
-            'redoc_url': '/redoc',
-            'openapi_url': '/openapi.json',
-            'timezone': 'UTC',
-            'locale': 'en_US',
-            'pagination_default_limit': 20,
-            'pagination_max_limit': 100
-        }
+    DEFAULTS: ClassVar[ApplicationDefaults] = ApplicationDefaults()
+    _DEFAULTS: ClassVar[Dict[str, Any]] = asdict(DEFAULTS)
     
-    def get_required_keys(self) -> List[str]:
-        return ['app_name', 'host', 'port']
+    def get_default_values(self) -> Dict[str, Any]:
+        return self._DEFAULTS
 
 class DatabaseConfiguration(BaseConfig):
     """Database configuration"""
     
-    def get_config_name(self) -> str:
-        return "database"
+    __slots__ = ()
+    CONFIG_NAME: ClassVar[str] = "database"
+    REQUIRED_KEYS: ClassVar[Tuple[str, ...]] = ('host', 'port', 'database', 'username', 'password')
     
     def get_default_values(self) -> Dict[str, Any]:
         return DatabaseConfig.get_defaults()
-    
-    def get_required_keys(self) -> List[str]:
-        return ['host', 'port', 'database', 'username', 'password']
 
 class CacheConfiguration(BaseConfig):
     """Cache configuration"""
     
-    def get_config_name(self) -> str:
-        return "cache"
+    __slots__ = ()
+    CONFIG_NAME: ClassVar[str] = "cache"
+    REQUIRED_KEYS: ClassVar[Tuple[str, ...]] = ('backend',)
     
     def get_default_values(self) -> Dict[str, Any]:
         return CacheConfig.get_defaults()
-    
-    def get_required_keys(self) -> List[str]:
-        return ['backend']
+
+@lru_cache(maxsize=1)
+def _generated_secret_key() -> str:
+    """Generate the fallback secret key once per process"""
+    return secrets.token_urlsafe(32)
 
 class SecurityConfiguration(BaseConfig):
     """Security configuration"""
     
-    def get_config_name(self) -> str:
-        return "security"
+    __slots__ = ()
+    CONFIG_NAME: ClassVar[str] = "security"
+    REQUIRED_KEYS: ClassVar[Tuple[str, ...]] = ('secret_key',)
     
     def get_default_values(self) -> Dict[str, Any]:
         defaults = SecurityConfig.get_defaults()
-        # Generate secret key if not provided
+        # Fall back to a per-process generated secret key if not provided
         if 'secret_key' not in defaults:
-            import secrets
-            defaults['secret_key'] = secrets.token_urlsafe(32)
+            if config_manager.get_environment() == ConfigEnvironment.PRODUCTION:
+                self._logger.warning("No secret_key configured, using a generated per-process key")
+            defaults['secret_key'] = _generated_secret_key()
         return defaults
-    
-    def get_required_keys(self) -> List[str]:
-        return ['secret_key']
 
 class LoggingConfiguration(BaseConfig):
     """Logging configuration"""
     
-    def get_config_name(self) -> str:
-        return "logging"
-    
-    def get_default_values(self) -> Dict[str, Any]:
-        return {
+    __slots__ = ()
+    CONFIG_NAME: ClassVar[str] = "logging"
+    REQUIRED_KEYS: ClassVar[Tuple[str, ...]] = ('level', 'format')
+    
+    _DEFAULTS: ClassVar[Dict[str, Any]] = {
+        'level': 'INFO',
+        'format': '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        'date_format': '%Y-%m-%d %H:%M:%S',
+        'handlers': ['console', 'file'],
+        'console_handler': {
+            'class': 'logging.StreamHandler',
             'level': 'INFO',
-            'format': '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            'date_format': '%Y-%m-%d %H:%M:%S',
-            'handlers': ['console', 'file'],
-            'console_handler': {
-                'class': 'logging.StreamHandler',
-                'level': 'INFO',
-                'formatter': 'default'
-            },
-            'file_handler': {
-                'class': 'logging.handlers.RotatingFileHandler',
-                'level': 'DEBUG',
-                'formatter': 'detailed',
-                'filename': 'logs/app.log',
-                'maxBytes': 10485760,  # 10MB
-                'backupCount': 5
-            },
-            'loggers': {
-                'uvicorn': {'level': 'INFO'},
-                'sqlalchemy': {'level': 'WARNING'},
-                'redis': {'level': 'WARNING'}
-            },
-            'disable_existing_loggers': False
-        }
+            'formatter': 'default'
+        },
+        'file_handler': {
+            'class': 'logging.handlers.RotatingFileHandler',
+            'level': 'DEBUG',
+            'formatter': 'detailed',
+            'filename': 'logs/app.log',
+            'maxBytes': 10485760,  # 10MB
+            'backupCount': 5
+        },
+        'loggers': {
+            'uvicorn': {'level': 'INFO'},
+            'sqlalchemy': {'level': 'WARNING'},
+            'redis': {'level': 'WARNING'}
+        },
+        'disable_existing_loggers': False
+    }
     
-    def get_required_keys(self) -> List[str]:
-        return ['level', 'format']
+    def get_default_values(self) -> Dict[str, Any]:
+        return self._DEFAULTS
 
 class PaymentConfiguration(BaseConfig):
     """Payment gateway configuration"""
     
-    def get_config_name(self) -> str:
-        return "payment"
+    __slots__ = ()
+    CONFIG_NAME: ClassVar[str] = "payment"
+    REQUIRED_KEYS: ClassVar[Tuple[str, ...]] = ('default_gateway', 'gateways')
     
-    def get_default_values(self) -> Dict[str, Any]:
-        return {
-            'default_gateway': 'midtrans',
-            'gateways': {
-                'midtrans': {
-                    'enabled': True,
-                    'sandbox': True,
-                    'server_key': '',
-                    'client_key': '',
-                    'merchant_id': '',
-                    'timeout': 30,
-                    'notification_url': '/api/v1/payment/midtrans/notification',
-                    'return_url': '/payment/success',
-                    'error_url': '/payment/error'
-                },
-                'xendit': {
-                    'enabled': False,
-                    'sandbox': True,
-                    'secret_key': '',
-                    'public_key': '',
-                    'webhook_token': '',
-                    'timeout': 30,
-                    'callback_url': '/api/v1/payment/xendit/callback'
-                },
-                'doku': {
-                    'enabled': False,
-                    'sandbox': True,
-                    'mall_id': '',
-                    'shared_key': '',
-                    'timeout': 30,
-                    'notify_url': '/api/v1/payment/doku/notify'
-                }
+    _DEFAULTS: ClassVar[Dict[str, Any]] = {
+        'default_gateway': 'midtrans',
+        'gateways': {
+            'midtrans': {
+                'enabled': True,
+                'sandbox': True,
+                'server_key': '',
+                'client_key': '',
+                'merchant_id': '',
+                'timeout': 30,
+                'notification_url': '/api/v1/payment/midtrans/notification',
+                'return_url': '/payment/success',
+                'error_url': '/payment/error'
             },
-            'auto_settlement': True,
-            'settlement_delay': 24,  # hours
-            'max_retry_attempts': 3,
-            'retry_delay': 300,  # seconds
-            'supported_currencies': ['IDR'],
-            'min_amount': 1000,
-            'max_amount': 50000000
-        }
+            'xendit': {
+                'enabled': False,
+                'sandbox': True,
+                'secret_key': '',
+                'public_key': '',
+                'webhook_token': '',
+                'timeout': 30,
+                'callback_url': '/api/v1/payment/xendit/callback'
+            },
+            'doku': {
+                'enabled': False,
+                'sandbox': True,
+                'mall_id': '',
+                'shared_key': '',
+                'timeout': 30,
+                'notify_url': '/api/v1/payment/doku/notify'
+            }
+        },
+        'auto_settlement': True,
+        'settlement_delay': 24,  # hours
+        'max_retry_attempts': 3,
+        'retry_delay': 300,  # seconds
+        'supported_currencies': ['IDR'],
+        'min_amount': 1000,
+        'max_amount': 50000000
+    }
     
-    def get_required_keys(self) -> List[str]:
-        return ['default_gateway', 'gateways']
+    def get_default_values(self) -> Dict[str, Any]:
+        return self._DEFAULTS
 
 class NotificationConfiguration(BaseConfig):
     """Notification system configuration"""
     
-    def get_config_name(self) -> str:
-        return "notification"
+    __slots__ = ()
+    CONFIG_NAME: ClassVar[str] = "notification"
+    REQUIRED_KEYS: ClassVar[Tuple[str, ...]] = ()
     
-    def get_default_values(self) -> Dict[str, Any]:
-        return {
-            'email': {
-                'enabled': True,
-                'provider': 'smtp',
-                'smtp': {
-                    'host': 'localhost',
-                    'port': 587,
-                    'username': '',
-                    'password': '',
-                    'use_tls': True,
-                    'use_ssl': False,
-                    'timeout': 30
-                },
-                'from_email': 'noreply@example.com',
-                'from_name': 'Digital Platform',
-                'templates_dir': 'templates/email',
-                'max_retry_attempts': 3
+    _DEFAULTS: ClassVar[Dict[str, Any]] = {
+        'email': {
+            'enabled': True,
+            'provider': 'smtp',
+            'smtp': {
+                'host': 'localhost',
+                'port': 587,
+                'username': '',
+                'password': '',
+                'use_tls': True,
+                'use_ssl': False,
+                'timeout': 30
             },
-            'sms': {
-                'enabled': True,
-                'provider': 'twilio',
-                'twilio': {
-                    'account_sid': '',
-                    'auth_token': '',
-                    'from_number': ''
-                },
-                'max_retry_attempts': 3
+            'from_email': 'noreply@example.com',
+            'from_name': 'Digital Platform',
+            'templates_dir': 'templates/email',
+            'max_retry_attempts': 3
+        },
+        'sms': {
+            'enabled': True,
+            'provider': 'twilio',
+            'twilio': {
+                'account_sid': '',
+                'auth_token': '',
+                'from_number': ''
             },
-            'push': {
-                'enabled': True,
-                'provider': 'firebase',
-                'firebase': {
-                    'server_key': '',
-                    'project_id': ''
-                },
-                'max_retry_attempts': 3
+            'max_retry_attempts': 3
+        },
+        'push': {
+            'enabled': True,
+            'provider': 'firebase',
+            'firebase': {
+                'server_key': '',
+                'project_id': ''
             },
-            'webhook': {
-                'enabled': True,
-                'timeout': 30,
-                'max_retry_attempts': 3,
-                'retry_delay': 60
-            }
+            'max_retry_attempts': 3
+        },
+        'webhook': {
+            'enabled': True,
+            'timeout': 30,
+            'max_retry_attempts': 3,
+            'retry_delay': 60
         }
+    }
     
-    def get_required_keys(self) -> List[str]:
-        return []
+    def get_default_values(self) -> Dict[str, Any]:
+        return self._DEFAULTS
 
 class PPOBConfiguration(BaseConfig):
     """PPOB (Payment Point Online Bank) configuration"""
     
-    def get_config_name(self) -> str:
-        return "ppob"
+    __slots__ = ()
+    CONFIG_NAME: ClassVar[str] = "ppob"
+    REQUIRED_KEYS: ClassVar[Tuple[str, ...]] = ('providers',)
     
-    def get_default_values(self) -> Dict[str, Any]:
-        return {
-            'providers': {
-                'mobilepulsa': {
-                    'enabled': True,
-                    'api_key': '',
-                    'secret_key': '',
-                    'base_url': 'https://api.mobilepulsa.net/v1',
-                    'timeout': 30,
-                    'max_retry_attempts': 3
-                }
+    _DEFAULTS: ClassVar[Dict[str, Any]] = {
+        'providers': {
+            'mobilepulsa': {
+                'enabled': True,
+                'api_key': '',
+                'secret_key': '',
+                'base_url': 'https://api.mobilepulsa.net/v1',
+                'timeout': 30,
+                'max_retry_attempts': 3
+            }
+        },
+        'categories': {
+            'pulsa': {
+                'enabled': True,
+                'commission_rate': 0.05,
+                'min_amount': 5000,
+                'max_amount': 1000000
             },
-            'categories': {
-                'pulsa': {
-                    'enabled': True,
-                    'commission_rate': 0.05,
-                    'min_amount': 5000,
-                    'max_amount': 1000000
-                },
-                'data': {
-                    'enabled': True,
-                    'commission_rate': 0.03,
-                    'min_amount': 5000,
-                    'max_amount': 500000
-                },
-                'pln': {
-                    'enabled': True,
-                    'commission_rate': 0.02,
-                    'min_amount': 20000,
-                    'max_amount': 5000000
-                },
-                'game': {
-                    'enabled': True,
-                    'commission_rate': 0.08,
-                    'min_amount': 5000,
-                    'max_amount': 2000000
-                }
+            'data': {
+                'enabled': True,
+                'commission_rate': 0.03,
+                'min_amount': 5000,
+                'max_amount': 500000
             },
-            'auto_process': True,
-            'process_delay': 5,  # seconds
-            'inquiry_timeout': 30,
-            'transaction_timeout': 60,
-            'status_check_interval': 30,
-            'max_status_checks': 10
-        }
+            'pln': {
+                'enabled': True,
+                'commission_rate': 0.02,
+                'min_amount': 20000,
+                'max_amount': 5000000
+            },
+            'game': {
+                'enabled': True,
+                'commission_rate': 0.08,
+                'min_amount': 5000,
+                'max_amount': 2000000
+            }
+        },
+        'auto_process': True,
+        'process_delay': 5,  # seconds
+        'inquiry_timeout': 30,
+        'transaction_timeout': 60,
+        'status_check_interval': 30,
+        'max_status_checks': 10
+    }
     
-    def get_required_keys(self) -> List[str]:
-        return ['providers']
+    def get_default_values(self) -> Dict[str, Any]:
+        return self._DEFAULTS
 
 class MonitoringConfiguration(BaseConfig):
     """Monitoring and metrics configuration"""
     
-    def get_config_name(self) -> str:
-        return "monitoring"
+    __slots__ = ()
+    CONFIG_NAME: ClassVar[str] = "monitoring"
+    REQUIRED_KEYS: ClassVar[Tuple[str, ...]] = ()
     
-    def get_default_values(self) -> Dict[str, Any]:
-        return {
+    _DEFAULTS: ClassVar[Dict[str, Any]] = {
+        'enabled': True,
+        'metrics': {
             'enabled': True,
-            'metrics': {
-                'enabled': True,
-                'endpoint': '/metrics',
-                'include_in_schema': False,
-                'collect_default_metrics': True,
-                'custom_metrics': {
-                    'request_duration': True,
-                    'request_count': True,
-                    'error_count': True,
-                    'active_connections': True
-                }
-            },
-            'health_check': {
-                'enabled': True,
-                'endpoint': '/health',
-                'include_in_schema': False,
-                'checks': {
-                    'database': True,
-                    'cache': True,
-                    'external_apis': True,
-                    'disk_space': True,
-                    'memory_usage': True
-                }
-            },
-            'alerting': {
-                'enabled': True,
-                'channels': {
-                    'email': {
-                        'enabled': True,
-                        'recipients': ['admin@example.com']
-                    },
-                    'slack': {
-                        'enabled': False,
-                        'webhook_url': '',
-                        'channel': '#alerts'
-                    }
+            'endpoint': '/metrics',
+            'include_in_schema': False,
+            'collect_default_metrics': True,
+            'custom_metrics': {
+                'request_duration': True,
+                'request_count': True,
+                'error_count': True,
+                'active_connections': True
+            }
+        },
+        'health_check': {
+            'enabled': True,
+            'endpoint': '/health',
+            'include_in_schema': False,
+            'checks': {
+                'database': True,
+                'cache': True,
+                'external_apis': True,
+                'disk_space': True,
+                'memory_usage': True
+            }
+        },
+        'alerting': {
+            'enabled': True,
+            'channels': {
+                'email': {
+                    'enabled': True,
+                    'recipients': ['admin@example.com']
                 },
-                'rules': {
-                    'high_error_rate': {
-                        'threshold': 0.05,
-                        'window': 300,  # seconds
-                        'severity': 'critical'
-                    },
-                    'high_response_time': {
-                        'threshold': 2.0,  # seconds
-                        'window': 300,
-                        'severity': 'warning'
-                    },
-                    'low_disk_space': {
-                        'threshold': 0.1,  # 10%
-                        'severity': 'warning'
-                    }
+                'slack': {
+                    'enabled': False,
+                    'webhook_url': '',
+                    'channel': '#alerts'
                 }
             },
-            'tracing': {
-                'enabled': False,
-                'service_name': 'digital-platform-api',
-                'jaeger': {
-                    'agent_host': 'localhost',
-                    'agent_port': 6831
+            'rules': {
+                'high_error_rate': {
+                    'threshold': 0.05,
+                    'window': 300,  # seconds
+                    'severity': 'critical'
+                },
+                'high_response_time': {
+                    'threshold': 2.0,  # seconds
+                    'window': 300,
+                    'severity': 'warning'
+                },
+                'low_disk_space': {
+                    'threshold': 0.1,  # 10%
+                    'severity': 'warning'
                 }
             }
+        },
+        'tracing': {
+            'enabled': False,
+            'service_name': 'digital-platform-api',
+            'jaeger': {
+                'agent_host': 'localhost',
+                'agent_port': 6831
+            }
         }
+    }
     
-    def get_required_keys(self) -> List[str]:
-        return []
+    def get_default_values(self) -> Dict[str, Any]:
+        return self._DEFAULTS
 
 class RateLimitConfiguration(BaseConfig):
     """Rate limiting configuration"""
     
-    def get_config_name(self) -> str:
-        return "rate_limit"
-    
-    def get_default_values(self) -> Dict[str, Any]:
-        return {
-            'enabled': True,
-            'storage': 'redis',
-            'default_limits': {
-                'requests_per_minute': 60,
-                'requests_per_hour': 1000,
-                'requests_per_day': 10000
+    CONFIG_NAME: ClassVar[str] = "rate_limit"
+    REQUIRED_KEYS: ClassVar[Tuple[str, ...]] = ()
+    
+    _DEFAULTS: ClassVar[Dict[str, Any]] = {
+        'enabled': True,
+        'storage': 'redis',
+        'default_limits': {
+            'requests_per_minute': 60,
+            'requests_per_hour': 1000,
+            'requests_per_day': 10000
+        },
+        'endpoint_limits': {
+            '/api/v1/auth/login': {
+                'requests_per_minute': 5,
+                'requests_per_hour': 20
             },
-            'endpoint_limits': {
-                '/api/v1/auth/login': {
-                    'requests_per_minute': 5,
-                    'requests_per_hour': 20
-                },
-                '/api/v1/auth/register': {
-                    'requests_per_minute': 3,
-                    'requests_per_hour': 10
-                },
-                '/api/v1/payment/*': {
-                    'requests_per_minute': 30,
-                    'requests_per_hour': 500
-                }
+            '/api/v1/auth/register': {
+                'requests_per_minute': 3,
+                'requests_per_hour': 10
             },
-            'user_type_limits': {
-                'guest': {
-                    'requests_per_minute': 30,
-                    'requests_per_hour': 500
-                },
-                'user': {
-                    'requests_per_minute': 60,
-                    'requests_per_hour': 1000
-                },
-                'partner': {
-                    'requests_per_minute': 120,
-                    'requests_per_hour': 2000
-                },
-                'admin': {
-                    'requests_per_minute': 300,
-                    'requests_per_hour': 5000
-                }
+            '/api/v1/payment/*': {
+                'requests_per_minute': 30,
+                'requests_per_hour': 500
+            }
+        },
+        'user_type_limits': {
+            'guest': {
+                'requests_per_minute': 30,
+                'requests_per_hour': 500
             },
-            'whitelist_ips': [],
-            'blacklist_ips': [],
-            'headers': {
-                'limit': 'X-RateLimit-Limit',
-                'remaining': 'X-RateLimit-Remaining',
-                'reset': 'X-RateLimit-Reset'
+            'user': {
+                'requests_per_minute': 60,
+                'requests_per_hour': 1000
             },
-            'error_message': 'Rate limit exceeded. Please try again later.',
-            'error_status_code': 429
-        }
+            'partner': {
+                'requests_per_minute': 120,
+                'requests_per_hour': 2000
+            },
+            'admin': {
+                'requests_per_minute': 300,
+                'requests_per_hour': 5000
+            }
+        },
+        'whitelist_ips': [],
+        'blacklist_ips': [],
+        'headers': {
+            'limit': 'X-RateLimit-Limit',
+            'remaining': 'X-RateLimit-Remaining',
+            'reset': 'X-RateLimit-Reset'
+        },
+        'error_message': 'Rate limit exceeded. Please try again later.',
+        'error_status_code': 429
+    }
     
-    def get_required_keys(self) -> List[str]:
-        return []
+    def get_default_values(self) -> Dict[str, Any]:
+        return self._DEFAULTS
 
 class TaskConfiguration(BaseConfig):
     """Background task configuration"""
     
-    def get_config_name(self) -> str:
-        return "tasks"
-    
-    def get_default_values(self) -> Dict[str, Any]:
-        return {
-            'broker': 'redis',
-            'backend': 'redis',
-            'redis': {
-                'host': 'localhost',
-                'port': 6379,
-                'db': 1,
-                'password': None
-            },
-            'rabbitmq': {
-                'host': 'localhost',
-                'port': 5672,
-                'username': 'guest',
-                'password': 'guest',
-                'virtual_host': '/'
-            },
-            'worker': {
-                'concurrency': 4,
-                'max_tasks_per_child': 1000,
-                'task_time_limit': 300,
-                'task_soft_time_limit': 240
-            },
-            'beat': {
-                'enabled': True,
-                'schedule': {
-                    'cleanup_expired_sessions': {
-                        'task': 'tasks.maintenance.cleanup.session_cleanup',
-                        'schedule': 3600.0  # every hour
-                    },
-                    'update_exchange_rates': {
-                        'task': 'tasks.ppob.maintenance.price_update',
-                        'schedule': 1800.0  # every 30 minutes
-                    },
-                    'generate_daily_reports': {
-                        'task': 'tasks.reporting.financial.daily_report',
-                        'schedule': {
-                            'hour': 1,
-                            'minute': 0
-                        }
+    __slots__ = ()
+    CONFIG_NAME: ClassVar[str] = "tasks"
+    REQUIRED_KEYS: ClassVar[Tuple[str, ...]] = ('broker',)
+    
+    _DEFAULTS: ClassVar[Dict[str, Any]] = {
+        'broker': 'redis',
+        'backend': 'redis',
+        'redis': {
+            'host': 'localhost',
+            'port': 6379,
+            'db': 1,
+            'password': None
+        },
+        'rabbitmq': {
+            'host': 'localhost',
+            'port': 5672,
+            'username': 'guest',
+            'password': 'guest',
+            'virtual_host': '/'
+        },
+        'worker': {
+            'concurrency': 4,
+            'max_tasks_per_child': 1000,
+            'task_time_limit': 300,
+            'task_soft_time_limit': 240
+        },
+        'beat': {
+            'enabled': True,
+            'schedule': {
+                'cleanup_expired_sessions': {
+                    'task': 'tasks.maintenance.cleanup.session_cleanup',
+                    'schedule': 3600.0  # every hour
+                },
+                'update_exchange_rates': {
+                    'task': 'tasks.ppob.maintenance.price_update',
+                    'schedule': 1800.0  # every 30 minutes
+                },
+                'generate_daily_reports': {
+                    'task': 'tasks.reporting.financial.daily_report',
+                    'schedule': {
+                        'hour': 1,
+                        'minute': 0
                     }
                 }
-            },
-            'routes': {
-                'email': 'email_queue',
-                'sms': 'sms_queue',
-                'push': 'push_queue',
-                'payment': 'payment_queue',
-                'ppob': 'ppob_queue',
-                'reports': 'reports_queue'
-            },
-            'retry': {
-                'max_retries': 3,
-                'retry_delay': 60,
-                'retry_backoff': True,
-                'retry_jitter': True
             }
+        },
+        'routes': {
+            'email': 'email_queue',
+            'sms': 'sms_queue',
+            'push': 'push_queue',
+            'payment': 'payment_queue',
+            'ppob': 'ppob_queue',
+            'reports': 'reports_queue'
+        },
+        'retry': {
+            'max_retries': 3,
+            'retry_delay': 60,
+            'retry_backoff': True,
+            'retry_jitter': True
         }
+    }
+    
+    def get_default_values(self) -> Dict[str, Any]:
+        return self._DEFAULTS
+
+# Intern default-dict keys once at import so every config shares the same key strings
+for _config_class in (
+    ApplicationConfig, LoggingConfiguration, PaymentConfiguration, NotificationConfiguration,
+    PPOBConfiguration, MonitoringConfiguration, RateLimitConfiguration, TaskConfiguration
+):
+    _intern_keys(_config_class._DEFAULTS)
+del _config_class
+
+@lru_cache(maxsize=None)
+def _app_schema() -> Dict[str, Any]:
+    """Application schema"""
+    return {
+        'app_name': {'type': str, 'required': True},
+        'port': {'type': int, 'min': 1, 'max': 65535},
+        'workers': {'type': int, 'min': 1, 'max': 32},
+        'debug': {'type': bool}
+    }
+
+@lru_cache(maxsize=None)
+def _db_schema() -> Dict[str, Any]:
+    """Database schema"""
+    return DatabaseConfig.get_schema()
+
+@lru_cache(maxsize=None)
+def _cache_schema() -> Dict[str, Any]:
+    """Cache schema"""
+    return CacheConfig.get_schema()
+
+@lru_cache(maxsize=None)
+def _security_schema() -> Dict[str, Any]:
+    """Security schema"""
+    return SecurityConfig.get_schema()
+
+_SCHEMA_BUILDERS: Dict[str, Callable[[], Dict[str, Any]]] = {
+    'application': _app_schema,
+    'database': _db_schema,
+    'cache': _cache_schema,
+    'security': _security_schema
+}
+
+@lru_cache(maxsize=None)
+def _validator_for(schema_name: str) -> SchemaValidator:
+    """Get the shared validator for a named schema"""
+    return SchemaValidator(_SCHEMA_BUILDERS[schema_name]())
+
+def _build_validators() -> Tuple[SchemaValidator, SchemaValidator, SchemaValidator, SchemaValidator]:
+    """Get the application, database, cache and security validators"""
+    return (
+        _validator_for('application'),
+        _validator_for('database'),
+        _validator_for('cache'),
+        _validator_for('security')
+    )
+
+class LazyConfigRegistry(Mapping):
+    """Read-only mapping of configuration name to instance that creates each config on first access"""
+    
+    def __init__(self, factories: Dict[str, Callable[[], BaseConfig]]):
+        self._factories = factories
+        self._instances: Dict[str, BaseConfig] = {}
+    
+    def __getitem__(self, name: str) -> BaseConfig:
+        config = self._instances.get(name)
+        if config is None:
+            config = self._instances[name] = self._factories[name]()
+        return config
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._factories)
     
-    def get_required_keys(self) -> List[str]:
-        return ['broker']
+    def __len__(self) -> int:
+        return len(self._factories)
+    
+    def is_instantiated(self, name: str) -> bool:
+        """Check if configuration has been created yet"""
+        return name in self._instances
 
 # Configuration factory for creating application configs
 class AppConfigFactory:
     """Factory for creating application-specific configurations"""
     
     @staticmethod
-    def create_all_configs() -> Dict[str, BaseConfig]:
-        """Create all application configurations"""
-        configs = {}
+    def get_config_factories(with_loaders: bool = False) -> Dict[str, Callable[[], BaseConfig]]:
+        """Get a factory callable per configuration name"""
+        # Validators are stateless between calls, so they are shared across factory runs
+        app_validator, db_validator, cache_validator, security_validator = _build_validators()
         
-        # Create validators for each config type
-        app_validator = SchemaValidator({
-            'app_name': {'type': str, 'required': True},
-            'port': {'type': int, 'min': 1, 'max': 65535},
-            'workers': {'type': int, 'min': 1, 'max': 32},
-            'debug': {'type': bool}
-        })
+        config_types = {
+            'application': (ApplicationConfig, app_validator),
+            'database': (DatabaseConfiguration, db_validator),
+            'cache': (CacheConfiguration, cache_validator),
+            'security': (SecurityConfiguration, security_validator),
+            'logging': (LoggingConfiguration, None),
+            'payment': (PaymentConfiguration, None),
+            'notification': (NotificationConfiguration, None),
+            'ppob': (PPOBConfiguration, None),
+            'monitoring': (MonitoringConfiguration, None),
+            'rate_limit': (RateLimitConfiguration, None),
+            'tasks': (TaskConfiguration, None)
+        }
         
-        db_validator = SchemaValidator(DatabaseConfig.get_schema())
-        cache_validator = SchemaValidator(CacheConfig.get_schema())
-        security_validator = SchemaValidator(SecurityConfig.get_schema())
+        # Loaders are stateless and all configs share one cache, each in its own namespace
+        loader = _shared_file_loader() if with_loaders else None
+        shared_cache = MemoryCache() if with_loaders else None
         
-        # Create configurations with validators
-        configs['application'] = ApplicationConfig(validator=app_validator)
-        configs['database'] = DatabaseConfiguration(validator=db_validator)
-        configs['cache'] = CacheConfiguration(validator=cache_validator)
-        configs['security'] = SecurityConfiguration(validator=security_validator)
-        configs['logging'] = LoggingConfiguration()
-        configs['payment'] = PaymentConfiguration()
-        configs['notification'] = NotificationConfiguration()
-        configs['ppob'] = PPOBConfiguration()
-        configs['monitoring'] = MonitoringConfiguration()
-        configs['rate_limit'] = RateLimitConfiguration()
-        configs['tasks'] = TaskConfiguration()
+        def make_factory(name: str, config_class: type, validator: Optional[SchemaValidator]) -> Callable[[], BaseConfig]:
+            if with_loaders:
+                return lambda: config_class(validator=validator, loader=loader, cache=shared_cache.namespace(name))
+            return lambda: config_class(validator=validator)
         
-        return configs
+        return {name: make_factory(name, *config_type) for name, config_type in config_types.items()}
+    
+    @staticmethod
+    def create_all_configs() -> Dict[str, BaseConfig]:
+        """Create all application configurations"""
+        return {name: factory() for name, factory in AppConfigFactory.get_config_factories().items()}
+    
+    @staticmethod
+    def create_lazy(with_loaders: bool = True) -> LazyConfigRegistry:
+        """Create a registry that instantiates configurations on first access"""
+        return LazyConfigRegistry(AppConfigFactory.get_config_factories(with_loaders))
+    
+    @staticmethod
+    def invalidate() -> None:
+        """Drop cached schemas and validators so the next factory call rebuilds them"""
+        _validator_for.cache_clear()
+        for schema_builder in _SCHEMA_BUILDERS.values():
+            schema_builder.cache_clear()
     
     @staticmethod
     def create_with_loaders(config_dir: str = "config") -> Dict[str, BaseConfig]:
-        """Create configurations with file and environment loaders"""
-        configs = AppConfigFactory.create_all_configs()
-        
-        # Add loaders to each configuration
-        for name, config in configs.items():
-            # Add file loader
-            file_loader = FileLoader()
-            config._loader = file_loader
-            
-            # Add environment loader with prefix
-            env_loader = EnvironmentLoader(f"{name.upper()}_")
-            
-            # Add memory cache
-            cache = MemoryCache()
-            config._cache = cache
-        
-        return configs
+        """Create configurations sharing one file loader and one memory cache"""
+        factories = AppConfigFactory.get_config_factories(with_loaders=True)
+        return {name: factory() for name, factory in factories.items()}
@@ -1,8 +1,14 @@
+from functools import lru_cache
 from typing import Optional
 from pydantic import BaseModel, DirectoryPath, FilePath
 from pathlib import Path
 from .environment import EnvironmentSettings
 
+@lru_cache(maxsize=None)
+def _base_dir() -> Path:
+    """Project root, computed once per process"""
+    return Path(__file__).parent.parent.parent
+
 class DatabaseSettings(BaseModel):
     """Database configuration with validation"""
     
@@ -28,7 +34,7 @@ class DatabaseSettings(BaseModel):
     @classmethod
     def from_env(cls, env: EnvironmentSettings) -> "DatabaseSettings":
         """Create settings from environment"""
-        base_dir = Path(__file__).parent.parent.parent
+        base_dir = _base_dir()
         
         settings = cls(
             path=base_dir / "data" / cls.model_fields["name"].default,
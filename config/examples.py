@@ -24,7 +24,8 @@ from config import (
     ApplicationConfig,
     SchemaValidator,
     FileLoader,
-    MemoryCache
+    MemoryCache,
+    config_manager
 )
 
 def basic_usage_example():
@@ -215,18 +216,42 @@ def performance_example():
     import time
     
     # Test configuration access performance
+    _get = get_config_value
     start_time = time.time()
     
     for i in range(1000):
-        app_name = get_config_value('application', 'app_name')
-        debug = get_config_value('application', 'debug')
-        port = get_config_value('application', 'port')
+        app_name = _get('application', 'app_name')
+        debug = _get('application', 'debug')
+        port = _get('application', 'port')
     
     end_time = time.time()
     duration = end_time - start_time
     
     print(f"1000 config accesses took: {duration:.4f} seconds")
     print(f"Average per access: {(duration/1000)*1000:.4f} ms")
+    
+    # Fetch all three values with a single call per iteration
+    _get_many = get_config('application').get_many
+    keys = ('app_name', 'debug', 'port')
+    start_time = time.time()
+    
+    for i in range(1000):
+        app_name, debug, port = _get_many(keys)
+    
+    duration = time.time() - start_time
+    print(f"1000 batched accesses took: {duration:.4f} seconds")
+    
+    # Specialized getters bound directly to each config
+    from config.codegen import build
+    getters = build(config_manager.get_all_configs())
+    get_app_name = getters.get_application_app_name
+    start_time = time.time()
+    
+    for i in range(1000):
+        app_name = get_app_name()
+    
+    duration = time.time() - start_time
+    print(f"1000 specialized accesses took: {duration:.4f} seconds")
 
 def main():
     """Run all examples"""
@@ -4,10 +4,16 @@ Provides concrete implementations of configuration interfaces
 """
 
 import os
+import sys
+import mmap
+import marshal
+import threading
 import json
 import yaml
 import configparser
-from typing import Dict, Any, List, Optional
+from typing import Callable, Dict, Any, Iterable, List, Optional, Set, FrozenSet, Tuple, Union
+from collections import OrderedDict
+from functools import lru_cache, partial
 import logging
 from pathlib import Path
 try:
@@ -16,6 +22,12 @@ try:
 except ImportError:
     REDIS_AVAILABLE = False
     redis = None
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
 import hashlib
 try:
     from cryptography.fernet import Fernet
@@ -24,7 +36,7 @@ except ImportError:
     CRYPTOGRAPHY_AVAILABLE = False
     Fernet = None
 import re
-from datetime import datetime, timedelta
+import time
 
 from .base import (
     IConfigValidator, IConfigLoader, IConfigSerializer, IConfigEncryption, 
@@ -32,12 +44,134 @@ from .base import (
 )
 
 # Validators
+def _compile_rule(rule: Dict[str, Any]) -> tuple:
+    """Compile a schema rule into a flat tuple consumed by SchemaValidator
+    
+    Choices become a frozenset for membership tests; the original sequence is
+    kept last for error messages.
+    """
+    pattern = rule.get('pattern')
+    choices = rule.get('choices')
+    try:
+        choice_set = frozenset(choices) if choices else None
+    except TypeError:
+        # Unhashable choices keep linear membership tests
+        choice_set = tuple(choices)
+    # A list of types becomes the tuple isinstance() expects
+    expected_type = rule.get('type')
+    if isinstance(expected_type, list):
+        expected_type = tuple(expected_type)
+    return (
+        expected_type,
+        rule.get('required', False),
+        rule.get('min'),
+        rule.get('max'),
+        re.compile(pattern) if isinstance(pattern, str) else pattern,
+        choice_set,
+        choices
+    )
+
+def _type_name(expected_type: Any) -> str:
+    """Name a type, or a tuple of alternative types, for error messages"""
+    if isinstance(expected_type, tuple):
+        return ' or '.join(t.__name__ for t in expected_type)
+    return expected_type.__name__
+
+def _in_choices(value: Any, choices: Any) -> bool:
+    """Membership test that treats unhashable values as not matching hashed choices"""
+    try:
+        return value in choices
+    except TypeError:
+        return False
+
+def _build_checks(key: str, rule: Dict[str, Any]) -> tuple:
+    """Specialize a schema rule into the checks it actually needs, in evaluation order"""
+    expected_type, required, min_value, max_value, pattern, choice_set, choices = _compile_rule(rule)
+    checks = []
+    
+    if expected_type:
+        checks.append((
+            lambda v: isinstance(v, expected_type),
+            f"'{key}' must be of type {_type_name(expected_type)}"
+        ))
+    if min_value is not None:
+        checks.append((
+            lambda v: not (isinstance(v, (int, float)) and v < min_value),
+            f"'{key}' must be >= {min_value}"
+        ))
+    if max_value is not None:
+        checks.append((
+            lambda v: not (isinstance(v, (int, float)) and v > max_value),
+            f"'{key}' must be <= {max_value}"
+        ))
+    if pattern:
+        checks.append((
+            lambda v: not isinstance(v, str) or pattern.match(v) is not None,
+            f"'{key}' does not match pattern {pattern.pattern}"
+        ))
+    if choices:
+        checks.append((
+            lambda v: _in_choices(v, choice_set),
+            f"'{key}' must be one of {choices}"
+        ))
+    
+    return required, tuple(checks)
+
+def _generate_batch_check(schema: Dict[str, Any]) -> Callable[[Dict[str, Any]], List[str]]:
+    """Generate a function validating a dict against schema with the rules inlined
+    
+    Produces the same messages as SchemaValidator.validate(), prefixed with the
+    key as validate_batch() reports them.
+    """
+    namespace: Dict[str, Any] = {'_MISSING': object(), '_in_choices': _in_choices}
+    lines = ['def _check(data):', '    errors = []']
+    
+    for index, (key, rule) in enumerate(schema.items()):
+        expected_type, required, min_value, max_value, pattern, choice_set, choices = _compile_rule(rule)
+        prefix = f"Key '{key}': '{key}'"
+        checks = []
+        if expected_type:
+            namespace[f'_t{index}'] = expected_type
+            checks.append((f'not isinstance(v, _t{index})', f"{prefix} must be of type {_type_name(expected_type)}"))
+        if min_value is not None:
+            checks.append((f'isinstance(v, (int, float)) and v < {min_value!r}', f"{prefix} must be >= {min_value}"))
+        if max_value is not None:
+            checks.append((f'isinstance(v, (int, float)) and v > {max_value!r}', f"{prefix} must be <= {max_value}"))
+        if pattern:
+            namespace[f'_p{index}'] = pattern
+            checks.append((f'isinstance(v, str) and not _p{index}.match(v)', f"{prefix} does not match pattern {pattern.pattern}"))
+        if choices:
+            namespace[f'_c{index}'] = choice_set
+            checks.append((f'not _in_choices(v, _c{index})', f"{prefix} must be one of {choices}"))
+        
+        lines.append(f'    v = data.get({key!r}, _MISSING)')
+        if required:
+            lines.append('    if v is None:')
+            lines.append(f'        errors.append({prefix + " is required"!r})')
+            keyword = 'elif'
+        else:
+            keyword = 'if'
+        if not checks:
+            continue
+        lines.append(f'    {keyword} v is not _MISSING and v is not None:')
+        for position, (condition, message) in enumerate(checks):
+            lines.append(f"        {'if' if position == 0 else 'elif'} {condition}:")
+            lines.append(f'            errors.append({message!r})')
+    
+    lines.append('    return errors')
+    exec(compile('\n'.join(lines), '<schema-validator>', 'exec'), namespace)
+    return namespace['_check']
+
 class SchemaValidator(IConfigValidator):
     """Schema-based configuration validator"""
     
     def __init__(self, schema: Dict[str, Any]):
         self.schema = schema
         self.errors: List[str] = []
+        # Per key: (required, (check, message) pairs for only the checks its rule uses)
+        self._checks: Dict[str, tuple] = {key: _build_checks(key, rule) for key, rule in schema.items()}
+        # Specialized batch check generated from the schema on first use
+        self._batch_check: Optional[Callable[[Dict[str, Any]], List[str]]] = None
         self._logger = logging.getLogger(__name__)
     
     def validate(self, key: str, value: Any) -> bool:
@@ -45,55 +179,43 @@ class SchemaValidator(IConfigValidator):
         self.errors.clear()
         
         try:
-            if key not in self.schema:
+            rule = self._checks.get(key)
+            if rule is None:
                 return True  # Allow unknown keys
             
-            expected_type = self.schema[key].get('type')
-            required = self.schema[key].get('required', False)
-            min_value = self.schema[key].get('min')
-            max_value = self.schema[key].get('max')
-            pattern = self.schema[key].get('pattern')
-            choices = self.schema[key].get('choices')
-            
-            # Check required
-            if required and value is None:
-                self.errors.append(f"'{key}' is required")
-                return False
-            
+            required, checks = rule
             if value is None:
-                return True
-            
-            # Check type
-            if expected_type and not isinstance(value, expected_type):
-                self.errors.append(f"'{key}' must be of type {expected_type.__name__}")
-                return False
-            
-            # Check min/max for numbers
-            if isinstance(value, (int, float)):
-                if min_value is not None and value < min_value:
-                    self.errors.append(f"'{key}' must be >= {min_value}")
-                    return False
-                if max_value is not None and value > max_value:
-                    self.errors.append(f"'{key}' must be <= {max_value}")
+                if required:
+                    self.errors.append(f"'{key}' is required")
                     return False
+                return True
             
-            # Check pattern for strings
-            if isinstance(value, str) and pattern:
-                if not re.match(pattern, value):
-                    self.errors.append(f"'{key}' does not match pattern {pattern}")
+            for check, message in checks:
+                if not check(value):
+                    self.errors.append(message)
                     return False
             
-            # Check choices
-            if choices and value not in choices:
-                self.errors.append(f"'{key}' must be one of {choices}")
-                return False
-            
             return True
             
         except Exception as e:
             self.errors.append(f"Validation error for '{key}': {e}")
             return False
     
+    def validate_batch(self, data: Dict[str, Any]) -> List[str]:
+        """Validate all values in data in one pass over the schema"""
+        try:
+            if self._batch_check is None:
+                self._batch_check = _generate_batch_check(self.schema)
+            errors = self._batch_check(data)
+        except Exception:
+            # Fall back to per-key validation, which reports errors per key
+            errors = []
+            for key in self.schema:
+                if key in data and not self.validate(key, data[key]):
+                    errors.extend(f"Key '{key}': {error}" for error in self.errors)
+        self.errors = errors.copy()
+        return errors
+    
     def get_validation_errors(self) -> List[str]:
         """Get validation errors"""
         return self.errors.copy()
@@ -122,6 +244,37 @@ class TypeValidator(IConfigValidator):
         return self.errors.copy()
 
 # Loaders
+def _intern_keys(data: Any) -> Any:
+    """Intern string keys of nested dicts in place so lookups can short-circuit on identity"""
+    pending = [data]
+    while pending:
+        current = pending.pop()
+        if not isinstance(current, dict):
+            continue
+        items = list(current.items())
+        current.clear()
+        for key, value in items:
+            current[sys.intern(key) if isinstance(key, str) else key] = value
+            if isinstance(value, dict):
+                pending.append(value)
+    return data
+
+# libyaml-backed loader and dumper when PyYAML was built with it
+_YamlSafeLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+_YamlDumper = getattr(yaml, 'CDumper', yaml.Dumper)
+
+# path -> ((mtime_ns, size, inode), marshalled data) for FileLoader, least recently used first
+_PARSED_FILES: 'OrderedDict[str, tuple]' = OrderedDict()
+_PARSED_FILES_LOCK = threading.Lock()
+_PARSED_FILES_MAX = 64
+# Upper bound on the marshalled bytes held across all cached files
+_PARSED_FILES_MAX_BYTES = 8 << 20
+
+_HAS_PREAD = hasattr(os, 'pread')
+
+# JSON files at least this large are parsed straight from a memory map
+_MMAP_MIN_SIZE = 1 << 20
+
 class FileLoader(IConfigLoader):
     """File-based configuration loader"""
     
@@ -129,80 +282,170 @@ class FileLoader(IConfigLoader):
         self._logger = logging.getLogger(__name__)
     
     def load(self, source: str) -> Dict[str, Any]:
-        """Load configuration from file"""
+        """Load configuration from file
+        
+        JSON is re-parsed on every call, which orjson does faster than any
+        copy of a cached result. Other formats are cached as marshalled data
+        by (mtime_ns, size, inode), so reloading an unchanged file only
+        unmarshals a fresh copy.
+        """
         file_path = Path(source)
         
-        if not file_path.exists():
+        try:
+            stat = os.stat(file_path)
+        except OSError:
             raise ConfigException(f"Configuration file not found: {source}")
         
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                if file_path.suffix.lower() == '.json':
-                    return json.load(f)
-                elif file_path.suffix.lower() in ['.yml', '.yaml']:
-                    return yaml.safe_load(f) or {}
-                elif file_path.suffix.lower() in ['.ini', '.cfg']:
-                    config = configparser.ConfigParser()
-                    config.read(file_path)
-                    return {section: dict(config[section]) for section in config.sections()}
+        cacheable = file_path.suffix.lower() != '.json'
+        if cacheable:
+            signature = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+            cache_key = os.fspath(file_path)
+            with _PARSED_FILES_LOCK:
+                cached = _PARSED_FILES.get(cache_key)
+                if cached is not None and cached[0] == signature:
+                    _PARSED_FILES.move_to_end(cache_key)
                 else:
-                    raise ConfigException(f"Unsupported file format: {file_path.suffix}")
+                    cached = None
+            if cached is not None:
+                return marshal.loads(cached[1])
         
+        try:
+            data = self._parse(file_path)
         except Exception as e:
             self._logger.error(f"Failed to load config from {source}: {e}")
             raise ConfigException(f"Failed to load config from {source}: {e}")
+        
+        if cacheable:
+            # marshal only handles plain data; anything else is parsed every time
+            try:
+                compiled = marshal.dumps(data)
+            except ValueError:
+                return data
+            if len(compiled) <= _PARSED_FILES_MAX_BYTES:
+                with _PARSED_FILES_LOCK:
+                    _PARSED_FILES[cache_key] = (signature, compiled)
+                    _PARSED_FILES.move_to_end(cache_key)
+                    # Evict least recently used paths until both count and size fit
+                    total = sum(len(entry[1]) for entry in _PARSED_FILES.values())
+                    while len(_PARSED_FILES) > _PARSED_FILES_MAX or total > _PARSED_FILES_MAX_BYTES:
+                        total -= len(_PARSED_FILES.popitem(last=False)[1][1])
+        return data
+    
+    @staticmethod
+    def _read(file_path: Path) -> bytes:
+        """Read whole file with a single pread, bypassing io buffering"""
+        # os.pread is POSIX-only (not available on Windows)
+        if not _HAS_PREAD:
+            with open(file_path, 'rb') as f:
+                return f.read()
+        fd = os.open(file_path, os.O_RDONLY)
+        try:
+            return os.pread(fd, os.fstat(fd).st_size, 0)
+        finally:
+            os.close(fd)
+    
+    @staticmethod
+    def _parse_json_mapped(file_path: Path) -> Dict[str, Any]:
+        """Parse a large JSON file from a read-only memory map without copying it"""
+        with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            with memoryview(mapped) as view:
+                return orjson.loads(view)
+    
+    def _parse(self, file_path: Path) -> Dict[str, Any]:
+        """Parse configuration file based on its extension"""
+        suffix = file_path.suffix.lower()
+        if suffix == '.json':
+            if ORJSON_AVAILABLE and os.stat(file_path).st_size >= _MMAP_MIN_SIZE:
+                return _intern_keys(self._parse_json_mapped(file_path))
+            raw = self._read(file_path)
+            if ORJSON_AVAILABLE:
+                return _intern_keys(orjson.loads(raw))
+            return _intern_keys(json.loads(raw.decode('utf-8')))
+        elif suffix in ['.yml', '.yaml']:
+            return _intern_keys(yaml.load(self._read(file_path).decode('utf-8'), Loader=_YamlSafeLoader) or {})
+        elif suffix in ['.ini', '.cfg']:
+            text = self._read(file_path).decode('utf-8')
+            # Without any '%' there is nothing to interpolate, so skip the interpolation pass
+            config = configparser.ConfigParser() if '%' in text else configparser.RawConfigParser()
+            config.read_string(text, source=os.fspath(file_path))
+            # items() yields materialized pairs (defaults included), skipping the SectionProxy layer
+            return _intern_keys({section: dict(config.items(section)) for section in config.sections()})
+        else:
+            raise ConfigException(f"Unsupported file format: {file_path.suffix}")
     
     def supports_source(self, source: ConfigSource) -> bool:
         """Check if loader supports source type"""
         return source == ConfigSource.FILE
 
+# Classifiers for environment values, so parsing never relies on failed conversions
+_ENV_BOOLS = {'true': True, 'false': False}
+_ENV_INT_RE = re.compile(r'\s*[-+]?\d+\s*')
+_ENV_FLOAT_RE = re.compile(r'\s*[-+]?(?:\d+\.\d*|\.\d+|\d+)(?:[eE][-+]?\d+)?\s*')
+_ENV_FLOAT_WORDS = frozenset({'inf', '+inf', '-inf', 'infinity', '+infinity', '-infinity', 'nan', '+nan', '-nan'})
+_ENV_JSON_STARTS = frozenset('{["')
+_ENV_JSON_LITERALS = frozenset({'null', 'true', 'false'})
+
+# Prefixes of every EnvironmentLoader created, so one environment scan serves them all
+_ENV_PREFIXES: Set[str] = set()
+
+@lru_cache(maxsize=1)
+def _env_snapshot(prefixes: FrozenSet[str]) -> Dict[str, Dict[str, str]]:
+    """Scan os.environ once, bucketing variables under every matching prefix"""
+    buckets: Dict[str, Dict[str, str]] = {prefix: {} for prefix in prefixes}
+    for key, value in os.environ.items():
+        for prefix in prefixes:
+            if key.startswith(prefix):
+                buckets[prefix][key] = value
+    return buckets
+
+def reload_env() -> None:
+    """Discard the cached environment snapshot so the next load rescans os.environ"""
+    _env_snapshot.cache_clear()
+
 class EnvironmentLoader(IConfigLoader):
-    """Environment variable configuration loader"""
+    """Environment variable configuration loader
+    
+    Variables are read from a process-wide snapshot of os.environ; call
+    reload_env() after modifying the environment at runtime.
+    """
     
     def __init__(self, prefix: str = ""):
         self.prefix = prefix
+        self._prefix_len = len(prefix)
+        _ENV_PREFIXES.add(prefix)
         self._logger = logging.getLogger(__name__)
     
     def load(self, source: str) -> Dict[str, Any]:
         """Load configuration from environment variables"""
-        config = {}
-        
-        for key, value in os.environ.items():
-            if self.prefix and not key.startswith(self.prefix):
-                continue
-            
-            # Remove prefix
-            config_key = key[len(self.prefix):] if self.prefix else key
-            config_key = config_key.lower()
-            
-            # Try to parse value
-            config[config_key] = self._parse_env_value(value)
-        
-        return config
+        # The snapshot bucket holds only variables with this prefix, so no filtering is needed
+        variables = _env_snapshot(frozenset(_ENV_PREFIXES))[self.prefix]
+        prefix_len = self._prefix_len
+        parse = self._parse_env_value
+        return {key[prefix_len:].lower(): parse(value) for key, value in variables.items()}
     
     def _parse_env_value(self, value: str) -> Any:
         """Parse environment variable value"""
+        lowered = value.lower()
+        
         # Try boolean
-        if value.lower() in ('true', 'false'):
-            return value.lower() == 'true'
+        if lowered in _ENV_BOOLS:
+            return _ENV_BOOLS[lowered]
         
         # Try integer
-        try:
+        if _ENV_INT_RE.fullmatch(value):
             return int(value)
-        except ValueError:
-            pass
         
         # Try float
-        try:
+        if _ENV_FLOAT_RE.fullmatch(value) or lowered.strip() in _ENV_FLOAT_WORDS:
             return float(value)
-        except ValueError:
-            pass
         
-        # Try JSON
-        try:
-            return json.loads(value)
-        except (json.JSONDecodeError, ValueError):
-            pass
+        # Try JSON only for values that can hold a JSON document
+        stripped = value.strip()
+        if stripped and (stripped[0] in _ENV_JSON_STARTS or stripped in _ENV_JSON_LITERALS):
+            try:
+                return json.loads(value)
+            except ValueError:
+                pass
         
         # Return as string
         return value
@@ -218,6 +461,10 @@ class JsonSerializer(IConfigSerializer):
     def serialize(self, data: Dict[str, Any]) -> str:
         """Serialize configuration data to JSON"""
         try:
+            if ORJSON_AVAILABLE:
+                return orjson.dumps(
+                    data, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                ).decode()
             return json.dumps(data, indent=2, default=str)
         except Exception as e:
             raise ConfigException(f"Failed to serialize to JSON: {e}")
@@ -225,6 +472,8 @@ class JsonSerializer(IConfigSerializer):
     def deserialize(self, data: str) -> Dict[str, Any]:
         """Deserialize JSON data to configuration"""
         try:
+            if ORJSON_AVAILABLE:
+                return orjson.loads(data)
             return json.loads(data)
         except Exception as e:
             raise ConfigException(f"Failed to deserialize JSON: {e}")
@@ -235,14 +484,14 @@ class YamlSerializer(IConfigSerializer):
     def serialize(self, data: Dict[str, Any]) -> str:
         """Serialize configuration data to YAML"""
         try:
-            return yaml.dump(data, default_flow_style=False)
+            return yaml.dump(data, Dumper=_YamlDumper, default_flow_style=False)
         except Exception as e:
             raise ConfigException(f"Failed to serialize to YAML: {e}")
     
     def deserialize(self, data: str) -> Dict[str, Any]:
         """Deserialize YAML data to configuration"""
         try:
-            return yaml.safe_load(data) or {}
+            return yaml.load(data, Loader=_YamlSafeLoader) or {}
         except Exception as e:
             raise ConfigException(f"Failed to deserialize YAML: {e}")
 
@@ -259,35 +508,53 @@ class FernetEncryption(IConfigEncryption):
         self.fernet = Fernet(key)
         self._logger = logging.getLogger(__name__)
     
-    def encrypt(self, value: str) -> str:
+    def encrypt(self, value: Union[str, bytes]) -> str:
         """Encrypt configuration value"""
         try:
-            encrypted = self.fernet.encrypt(value.encode())
-            return encrypted.decode()
+            return self._encrypt(value)
         except Exception as e:
             self._logger.error(f"Encryption failed: {e}")
             raise ConfigException(f"Encryption failed: {e}")
     
-    def decrypt(self, encrypted_value: str) -> str:
+    def decrypt(self, encrypted_value: Union[str, bytes]) -> str:
         """Decrypt configuration value"""
         try:
-            decrypted = self.fernet.decrypt(encrypted_value.encode())
-            return decrypted.decode()
+            # Fernet accepts str and bytes tokens alike
+            return self.fernet.decrypt(encrypted_value).decode()
         except Exception as e:
             self._logger.error(f"Decryption failed: {e}")
             raise ConfigException(f"Decryption failed: {e}")
+    
+    def encrypt_many(self, values: Iterable[Union[str, bytes]]) -> List[str]:
+        """Encrypt several values under a single error handler"""
+        encrypt = self._encrypt
+        try:
+            return [encrypt(value) for value in values]
+        except Exception as e:
+            self._logger.error(f"Encryption failed: {e}")
+            raise ConfigException(f"Encryption failed: {e}")
+    
+    def _encrypt(self, value: Union[str, bytes]) -> str:
+        """Encrypt without error wrapping; bytes input skips the encode step"""
+        data = value if isinstance(value, (bytes, bytearray)) else value.encode()
+        return self.fernet.encrypt(bytes(data) if isinstance(data, bytearray) else data).decode()
 
 class HashEncryption(IConfigEncryption):
     """Hash-based configuration encryption (one-way)"""
     
     def __init__(self, algorithm: str = 'sha256'):
         self.algorithm = algorithm
+        # Resolve the hash constructor once instead of by name on every call
+        if algorithm in hashlib.algorithms_guaranteed and hasattr(hashlib, algorithm):
+            self._constructor = getattr(hashlib, algorithm)
+        else:
+            self._constructor = partial(hashlib.new, algorithm)
         self._logger = logging.getLogger(__name__)
     
     def encrypt(self, value: str) -> str:
         """Hash configuration value"""
         try:
-            hash_obj = hashlib.new(self.algorithm)
+            hash_obj = self._constructor()
             hash_obj.update(value.encode())
             return hash_obj.hexdigest()
         except Exception as e:
@@ -299,43 +566,81 @@ class HashEncryption(IConfigEncryption):
         raise ConfigException("Hash encryption is one-way, cannot decrypt")
 
 # Cache
+def _get_live_entry(entries: Dict[Any, Tuple[Any, Optional[float]]], key: Any) -> Optional[Any]:
+    """Get a cached value from entries, dropping it once its TTL has passed"""
+    entry = entries.get(key)
+    if entry is None:
+        return None
+    
+    # Check TTL
+    value, expiry = entry
+    if expiry is not None and time.monotonic() > expiry:
+        entries.pop(key, None)
+        return None
+    return value
+
 class MemoryCache(IConfigCache):
     """In-memory configuration cache"""
     
     def __init__(self):
-        self._cache: Dict[str, Any] = {}
-        self._ttl: Dict[str, datetime] = {}
-        self._logger = logging.getLogger(__name__)
+        # key -> (value, time.monotonic() expiry deadline or None)
+        self._entries: Dict[str, Tuple[Any, Optional[float]]] = {}
+        # namespace -> its own entries dict, so clearing one never scans the others
+        self._namespaces: Dict[str, Dict[str, Tuple[Any, Optional[float]]]] = {}
     
     def get(self, key: str) -> Optional[Any]:
         """Get cached configuration value"""
-        if key in self._cache:
-            # Check TTL
-            if key in self._ttl and datetime.now() > self._ttl[key]:
-                self.invalidate(key)
-                return None
-            return self._cache[key]
-        return None
+        return _get_live_entry(self._entries, key)
     
     def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
         """Set cached configuration value"""
-        self._cache[key] = value
-        if ttl:
-            self._ttl[key] = datetime.now() + timedelta(seconds=ttl)
-        elif key in self._ttl:
-            del self._ttl[key]
+        self._entries[key] = (value, time.monotonic() + ttl if ttl else None)
     
     def invalidate(self, key: str) -> None:
         """Invalidate cached configuration"""
-        if key in self._cache:
-            del self._cache[key]
-        if key in self._ttl:
-            del self._ttl[key]
+        self._entries.pop(key, None)
     
     def clear(self) -> None:
-        """Clear all cached configurations"""
-        self._cache.clear()
-        self._ttl.clear()
+        """Clear all cached configurations, namespaced ones included"""
+        self._entries.clear()
+        for entries in list(self._namespaces.values()):
+            entries.clear()
+    
+    def namespace(self, name: str) -> 'NamespacedCache':
+        """Get a view of this cache whose keys are scoped to name"""
+        return NamespacedCache(self, name)
+    
+    def clear_namespace(self, name: str) -> None:
+        """Clear cached configurations stored under a namespace"""
+        entries = self._namespaces.get(name)
+        if entries is not None:
+            entries.clear()
+
+class NamespacedCache(IConfigCache):
+    """Per-configuration view over a shared MemoryCache, backed by its own entries dict"""
+    
+    __slots__ = ('_cache', '_namespace', '_entries')
+    
+    def __init__(self, cache: MemoryCache, namespace: str):
+        self._cache = cache
+        self._namespace = namespace
+        self._entries = cache._namespaces.setdefault(namespace, {})
+    
+    def get(self, key: str) -> Optional[Any]:
+        """Get cached configuration value"""
+        return _get_live_entry(self._entries, key)
+    
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        """Set cached configuration value"""
+        self._entries[key] = (value, time.monotonic() + ttl if ttl else None)
+    
+    def invalidate(self, key: str) -> None:
+        """Invalidate cached configuration"""
+        self._entries.pop(key, None)
+    
+    def clear(self) -> None:
+        """Clear cached configurations of this namespace only"""
+        self._entries.clear()
 
 class RedisCache(IConfigCache):
     """Redis-based configuration cache"""
@@ -353,7 +658,8 @@ class RedisCache(IConfigCache):
         try:
             value = self.redis.get(f"{self.prefix}{key}")
             if value:
-                return json.loads(value.decode())
+                # Both parsers accept the raw bytes, so no separate decode step
+                return orjson.loads(value) if ORJSON_AVAILABLE else json.loads(value)
             return None
         except Exception as e:
             self._logger.error(f"Redis cache get failed: {e}")
@@ -362,11 +668,12 @@ class RedisCache(IConfigCache):
     def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
         """Set cached configuration value"""
         try:
-            serialized = json.dumps(value, default=str)
-            if ttl:
-                self.redis.setex(f"{self.prefix}{key}", ttl, serialized)
+            if ORJSON_AVAILABLE:
+                serialized = orjson.dumps(value, default=str, option=orjson.OPT_NON_STR_KEYS)
             else:
-                self.redis.set(f"{self.prefix}{key}", serialized)
+                serialized = json.dumps(value, default=str)
+            # ex=None stores the value without expiry
+            self.redis.set(self.prefix + str(key), serialized, ex=ttl or None)
         except Exception as e:
             self._logger.error(f"Redis cache set failed: {e}")
     
@@ -380,9 +687,17 @@ class RedisCache(IConfigCache):
     def clear(self) -> None:
         """Clear all cached configurations"""
         try:
-            keys = self.redis.keys(f"{self.prefix}*")
-            if keys:
-                self.redis.delete(*keys)
+            # SCAN walks the keyspace incrementally instead of blocking the server
+            # like KEYS; UNLINK frees memory on a background thread
+            pipe = self.redis.pipeline(transaction=False)
+            cursor = 0
+            while True:
+                cursor, keys = self.redis.scan(cursor=cursor, match=f"{self.prefix}*", count=1000)
+                if keys:
+                    pipe.unlink(*keys)
+                if cursor == 0:
+                    break
+            pipe.execute()
         except Exception as e:
             self._logger.error(f"Redis cache clear failed: {e}")
 
@@ -474,59 +789,72 @@ class SecurityConfig:
         }
 
 # Factory for creating common configurations
+@lru_cache(maxsize=1)
+def _shared_file_loader() -> FileLoader:
+    """FileLoader keeps no per-file state, so one instance serves every path"""
+    return FileLoader()
+
+def create_file_loader(file_path: str) -> FileLoader:
+    """Create file loader"""
+    return _shared_file_loader()
+
+def create_env_loader(prefix: str = "") -> EnvironmentLoader:
+    """Create environment loader"""
+    return EnvironmentLoader(prefix)
+
+def create_schema_validator(schema: Dict[str, Any]) -> SchemaValidator:
+    """Create schema validator"""
+    return SchemaValidator(schema)
+
+def create_type_validator(type_mapping: Dict[str, type]) -> TypeValidator:
+    """Create type validator"""
+    return TypeValidator(type_mapping)
+
+def create_memory_cache() -> MemoryCache:
+    """Create memory cache"""
+    return MemoryCache()
+
+def create_redis_cache(redis_client: Optional['redis.Redis'] = None, prefix: str = "config:") -> RedisCache:
+    """Create Redis cache"""
+    if not REDIS_AVAILABLE:
+        raise ConfigException("Redis is not available. Install redis package to use RedisCache.")
+    return RedisCache(redis_client, prefix)
+
+def create_fernet_encryption(key: Optional[bytes] = None) -> FernetEncryption:
+    """Create Fernet encryption"""
+    if not CRYPTOGRAPHY_AVAILABLE:
+        raise ConfigException("Cryptography is not available. Install cryptography package to use FernetEncryption.")
+    return FernetEncryption(key)
+
+# Stateless implementations are created once and shared
+@lru_cache(maxsize=None)
+def create_hash_encryption(algorithm: str = 'sha256') -> HashEncryption:
+    """Create hash encryption"""
+    return HashEncryption(algorithm)
+
+@lru_cache(maxsize=None)
+def create_json_serializer() -> JsonSerializer:
+    """Create JSON serializer"""
+    return JsonSerializer()
+
+@lru_cache(maxsize=None)
+def create_yaml_serializer() -> YamlSerializer:
+    """Create YAML serializer"""
+    return YamlSerializer()
+
 class ConfigFactory:
-    """Factory for creating common configuration implementations"""
-    
-    @staticmethod
-    def create_file_loader(file_path: str) -> FileLoader:
-        """Create file loader"""
-        return FileLoader()
-    
-    @staticmethod
-    def create_env_loader(prefix: str = "") -> EnvironmentLoader:
-        """Create environment loader"""
-        return EnvironmentLoader(prefix)
-    
-    @staticmethod
-    def create_schema_validator(schema: Dict[str, Any]) -> SchemaValidator:
-        """Create schema validator"""
-        return SchemaValidator(schema)
-    
-    @staticmethod
-    def create_type_validator(type_mapping: Dict[str, type]) -> TypeValidator:
-        """Create type validator"""
-        return TypeValidator(type_mapping)
-    
-    @staticmethod
-    def create_memory_cache() -> MemoryCache:
-        """Create memory cache"""
-        return MemoryCache()
-    
-    @staticmethod
-    def create_redis_cache(redis_client: Optional['redis.Redis'] = None, prefix: str = "config:") -> RedisCache:
-        """Create Redis cache"""
-        if not REDIS_AVAILABLE:
-            raise ConfigException("Redis is not available. Install redis package to use RedisCache.")
-        return RedisCache(redis_client, prefix)
-    
-    @staticmethod
-    def create_fernet_encryption(key: Optional[bytes] = None) -> FernetEncryption:
-        """Create Fernet encryption"""
-        if not CRYPTOGRAPHY_AVAILABLE:
-            raise ConfigException("Cryptography is not available. Install cryptography package to use FernetEncryption.")
-        return FernetEncryption(key)
-    
-    @staticmethod
-    def create_hash_encryption(algorithm: str = 'sha256') -> HashEncryption:
-        """Create hash encryption"""
-        return HashEncryption(algorithm)
-    
-    @staticmethod
-    def create_json_serializer() -> JsonSerializer:
-        """Create JSON serializer"""
-        return JsonSerializer()
-    
-    @staticmethod
-    def create_yaml_serializer() -> YamlSerializer:
-        """Create YAML serializer"""
-        return YamlSerializer()
+    """Factory for creating common configuration implementations
+    
+    Kept for backwards compatibility; delegates to the module-level create_* functions.
+    """
+    
+    create_file_loader = staticmethod(create_file_loader)
+    create_env_loader = staticmethod(create_env_loader)
+    create_schema_validator = staticmethod(create_schema_validator)
+    create_type_validator = staticmethod(create_type_validator)
+    create_memory_cache = staticmethod(create_memory_cache)
+    create_redis_cache = staticmethod(create_redis_cache)
+    create_fernet_encryption = staticmethod(create_fernet_encryption)
+    create_hash_encryption = staticmethod(create_hash_encryption)
+    create_json_serializer = staticmethod(create_json_serializer)
+    create_yaml_serializer = staticmethod(create_yaml_serializer)
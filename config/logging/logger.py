@@ -1,9 +1,12 @@
+import atexit
 import logging
 import os
+import queue
 import sys
+import threading
 from datetime import datetime
-from logging.handlers import RotatingFileHandler, TimedRotatingFileHandler
-from typing import Optional
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler, TimedRotatingFileHandler
+from typing import Dict, Optional
 
 def setup_logger(
     name: str = __name__,
@@ -31,12 +34,6 @@ def setup_logger(
     # Buat logger
     logger = logging.getLogger(name)
     
-    # Hindari duplikasi handler jika logger sudah ada
-    if logger.handlers:
-        return logger
-    
-    logger.setLevel(level)
-    
     # Format default
     if format_string is None:
         format_string = (
@@ -44,38 +41,146 @@ def setup_logger(
             '[%(filename)s:%(lineno)d] - %(message)s'
         )
     
-    formatter = logging.Formatter(
-        format_string,
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
+    file_error = None
+    with _shared_lock:
+        # Hindari duplikasi handler jika logger sudah ada
+        if logger.handlers:
+            return logger
+        
+        logger.setLevel(level)
+        
+        # Logger hanya memasukkan record ke queue bersama; I/O console dan file
+        # dikerjakan oleh satu thread listener untuk semua logger
+        _configure_once()
+        formatter = logging.Formatter(format_string, datefmt=_DATE_FORMAT)
+        _shared_formatters[name] = formatter
+        
+        # File handler (jika log_file diberikan)
+        if log_file:
+            try:
+                # Buat direktori jika belum ada
+                log_dir = os.path.dirname(log_file)
+                if log_dir and not os.path.exists(log_dir):
+                    os.makedirs(log_dir, exist_ok=True)
+                
+                # Rotating file handler, hanya untuk record dari logger ini
+                file_handler = RotatingFileHandler(
+                    log_file,
+                    maxBytes=max_bytes,
+                    backupCount=backup_count,
+                    encoding='utf-8'
+                )
+                file_handler.setLevel(level)
+                file_handler.setFormatter(formatter)
+                file_handler.addFilter(logging.Filter(name))
+                _shared_listener.handlers = _shared_listener.handlers + (file_handler,)
+                
+            except Exception as e:
+                file_error = e
+        
+        logger.addHandler(_shared_queue_handler)
+    
+    if file_error is not None:
+        logger.warning(f"Tidak dapat membuat file log {log_file}: {file_error}")
+    
+    return logger
+
+_DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+# Format ringkas untuk logger bervolume tinggi; tanpa field lokasi pemanggil
+FAST_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+
+# Field format yang membutuhkan findCaller() (stack walk) per record
+_CALLER_FIELDS = ('%(pathname)', '%(filename)', '%(module)', '%(lineno)', '%(funcName)')
+_UNKNOWN_CALLER = ("(unknown file)", 0, "(unknown function)", None)
+
+def _skip_caller_lookup(logger: logging.Logger, format_string: str) -> None:
+    """
+    Lewati findCaller() untuk logger yang formatnya tidak memakai lokasi pemanggil
+    
+    Hanya berlaku selama logger tidak propagate: handler root (mis. format
+    'detailed' dari setup_logging_from_config) tetap butuh lokasi pemanggil.
+    """
+    if any(field in format_string for field in _CALLER_FIELDS):
+        return
+    
+    find_caller = logger.findCaller
+    
+    def findCaller(stack_info=False, stacklevel=1):
+        # stack_info dan record yang diteruskan ke root tetap membutuhkan stack asli
+        if stack_info or logger.propagate:
+            return find_caller(stack_info, stacklevel + 1)
+        return _UNKNOWN_CALLER
+    
+    logger.findCaller = findCaller
+
+# Pipeline bersama untuk logger bawaan: satu queue, satu listener, satu console
+# handler, dan satu file handler per tujuan yang disaring berdasarkan nama logger
+_shared_lock = threading.Lock()
+_shared_queue_handler: Optional[QueueHandler] = None
+_shared_listener: Optional[QueueListener] = None
+_shared_formatters: Dict[str, logging.Formatter] = {}
+
+class _NameRoutingFormatter(logging.Formatter):
+    """Format record dengan formatter milik logger asalnya (atau parent terdekat)"""
+    
+    def format(self, record: logging.LogRecord) -> str:
+        name = record.name
+        while name not in _shared_formatters and '.' in name:
+            name = name.rsplit('.', 1)[0]
+        formatter = _shared_formatters.get(name)
+        return formatter.format(record) if formatter else super().format(record)
+
+def _configure_once() -> None:
+    """Bangun queue, listener, dan console handler bersama satu kali saja"""
+    global _shared_queue_handler, _shared_listener
+    if _shared_listener is not None:
+        return
     
-    # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(level)
-    console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+    console_handler.setFormatter(_NameRoutingFormatter(datefmt=_DATE_FORMAT))
+    
+    log_queue = queue.Queue(-1)
+    _shared_queue_handler = QueueHandler(log_queue)
+    _shared_listener = QueueListener(log_queue, console_handler, respect_handler_level=True)
+    _shared_listener.start()
+    atexit.register(_shared_listener.stop)
+
+def _get_shared_logger(name: str, level: int, file_name: str, format_string: str) -> logging.Logger:
+    """Daftarkan logger ke pipeline bersama dengan file log dan format miliknya"""
+    logger = logging.getLogger(name)
     
-    # File handler (jika log_file diberikan)
-    if log_file:
+    with _shared_lock:
+        # Hindari duplikasi handler jika logger sudah ada
+        if logger.handlers:
+            return logger
+        
+        _configure_once()
+        formatter = logging.Formatter(format_string, datefmt=_DATE_FORMAT)
+        _shared_formatters[name] = formatter
+        logger.setLevel(level)
+        _skip_caller_lookup(logger, format_string)
+        
+        log_file = os.path.join(os.getcwd(), 'logs', file_name)
+        file_error = None
         try:
-            # Buat direktori jika belum ada
-            log_dir = os.path.dirname(log_file)
-            if log_dir and not os.path.exists(log_dir):
-                os.makedirs(log_dir, exist_ok=True)
-            
-            # Rotating file handler
+            os.makedirs(os.path.dirname(log_file), exist_ok=True)
             file_handler = RotatingFileHandler(
                 log_file,
-                maxBytes=max_bytes,
-                backupCount=backup_count,
+                maxBytes=10 * 1024 * 1024,
+                backupCount=5,
                 encoding='utf-8'
             )
-            file_handler.setLevel(level)
             file_handler.setFormatter(formatter)
-            logger.addHandler(file_handler)
-            
+            file_handler.addFilter(logging.Filter(name))
+            _shared_listener.handlers = _shared_listener.handlers + (file_handler,)
         except Exception as e:
-            logger.warning(f"Tidak dapat membuat file log {log_file}: {e}")
+            file_error = e
+        
+        logger.addHandler(_shared_queue_handler)
+    
+    if file_error is not None:
+        logger.warning(f"Tidak dapat membuat file log {log_file}: {file_error}")
     
     return logger
 
@@ -94,18 +199,12 @@ def get_app_logger(app_name: str = "BK") -> logging.Logger:
     debug_mode = os.getenv('DEBUG', 'False').lower() == 'true'
     log_level = logging.DEBUG if debug_mode else logging.INFO
     
-    # Path file log
-    log_dir = os.path.join(os.getcwd(), 'logs')
-    log_file = os.path.join(log_dir, f'{app_name.lower()}.log')
-    
-    return setup_logger(
-        name=app_name,
-        level=log_level,
-        log_file=log_file,
-        format_string=(
-            '%(asctime)s - %(name)s - %(levelname)s - '
-            '[%(process)d:%(thread)d] - %(message)s'
-        )
+    return _get_shared_logger(
+        app_name,
+        log_level,
+        f'{app_name.lower()}.log',
+        '%(asctime)s - %(name)s - %(levelname)s - '
+        '[%(process)d:%(thread)d] - %(message)s'
     )
 
 def get_request_logger() -> logging.Logger:
@@ -116,16 +215,11 @@ def get_request_logger() -> logging.Logger:
         Logger instance untuk request
     """
     
-    log_dir = os.path.join(os.getcwd(), 'logs')
-    log_file = os.path.join(log_dir, 'requests.log')
-    
-    return setup_logger(
-        name="requests",
-        level=logging.INFO,
-        log_file=log_file,
-        format_string=(
-            '%(asctime)s - %(levelname)s - %(message)s'
-        )
+    return _get_shared_logger(
+        "requests",
+        logging.INFO,
+        'requests.log',
+        FAST_FORMAT
     )
 
 def get_error_logger() -> logging.Logger:
@@ -136,44 +230,62 @@ def get_error_logger() -> logging.Logger:
         Logger instance untuk error
     """
     
-    log_dir = os.path.join(os.getcwd(), 'logs')
-    log_file = os.path.join(log_dir, 'errors.log')
-    
-    return setup_logger(
-        name="errors",
-        level=logging.ERROR,
-        log_file=log_file,
-        format_string=(
-            '%(asctime)s - %(name)s - %(levelname)s - '
-            '[%(filename)s:%(lineno)d] - %(funcName)s() - %(message)s'
-        )
+    return _get_shared_logger(
+        "errors",
+        logging.ERROR,
+        'errors.log',
+        '%(asctime)s - %(name)s - %(levelname)s - '
+        '[%(filename)s:%(lineno)d] - %(funcName)s() - %(message)s'
     )
 
-# Logger default untuk aplikasi
-app_logger = get_app_logger()
-request_logger = get_request_logger()
-error_logger = get_error_logger()
+# Logger default untuk aplikasi; dibangun saat pertama diakses lewat
+# __getattr__ modul, sehingga import modul ini tidak membuat file log
+_DEFAULT_LOGGERS = {
+    'app_logger': get_app_logger,
+    'request_logger': get_request_logger,
+    'error_logger': get_error_logger,
+}
+
+def _default_logger(name: str) -> logging.Logger:
+    """Bangun logger default lalu simpan di modul agar akses berikutnya langsung"""
+    logger = _DEFAULT_LOGGERS[name]()
+    globals()[name] = logger
+    return logger
+
+def __getattr__(name: str) -> logging.Logger:
+    # PEP 562: `from config.logging.logger import app_logger` tetap berfungsi
+    if name in _DEFAULT_LOGGERS:
+        return _default_logger(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def _helper_logger(logger_name: str) -> logging.Logger:
+    """Logger untuk fungsi helper; logger "BK" dibangun lewat factory agar handler-nya terpasang"""
+    if logger_name == "BK":
+        logger = globals().get('app_logger')
+        return logger if logger is not None else _default_logger('app_logger')
+    return logging.getLogger(logger_name)
 
 # Fungsi helper untuk logging cepat
 def log_info(message: str, logger_name: str = "BK"):
     """Log pesan info"""
-    logging.getLogger(logger_name).info(message)
+    _helper_logger(logger_name).info(message)
 
 def log_error(message: str, logger_name: str = "BK", exc_info: bool = False):
     """Log pesan error"""
-    logging.getLogger(logger_name).error(message, exc_info=exc_info)
+    _helper_logger(logger_name).error(message, exc_info=exc_info)
 
 def log_warning(message: str, logger_name: str = "BK"):
     """Log pesan warning"""
-    logging.getLogger(logger_name).warning(message)
+    _helper_logger(logger_name).warning(message)
 
 def log_debug(message: str, logger_name: str = "BK"):
     """Log pesan debug"""
-    logging.getLogger(logger_name).debug(message)
+    _helper_logger(logger_name).debug(message)
 
 # Export fungsi utama
 __all__ = [
     'setup_logger',
+    'FAST_FORMAT',
     'get_app_logger', 
     'get_request_logger',
     'get_error_logger',
@@ -3,23 +3,58 @@ Enhanced Configuration Manager
 Implements advanced design patterns: Factory, Builder, Strategy, Dependency Injection
 """
 
-from typing import Dict, Type, Optional, List, Any, Callable, Union
+from typing import Dict, Type, Optional, List, Any, Callable, Union, Tuple, Mapping
+from types import MappingProxyType
+from weakref import WeakValueDictionary
 from abc import ABC, abstractmethod
 from enum import Enum
+import sys
+import copy
+import time
 import threading
 import logging
 from pathlib import Path
 import json
 import yaml
 import os
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
 from datetime import datetime
 
+_logger = logging.getLogger(__name__)
+
+# libyaml-backed loader/dumper when PyYAML was built with it
+_YamlSafeLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+_YamlDumper = getattr(yaml, 'CDumper', yaml.Dumper)
+
 from .base import (
     BaseConfig, IConfigValidator, IConfigLoader, IConfigSerializer, 
     IConfigEncryption, IConfigCache, IConfigObserver, ConfigSource,
-    ConfigException, ConfigLoadError, ConfigValidationError
+    ConfigException, ConfigLoadError, ConfigValidationError, _MISSING
 )
 
+def _deep_getsizeof(data: Any) -> int:
+    """Approximate the memory held by nested dicts/lists via sys.getsizeof"""
+    total = 0
+    seen = set()
+    pending = [data]
+    while pending:
+        obj = pending.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        total += sys.getsizeof(obj)
+        if isinstance(obj, dict):
+            pending.extend(obj.keys())
+            pending.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            pending.extend(obj)
+    return total
+
 class ConfigStrategy(Enum):
     """Configuration loading strategies"""
     LAZY = "lazy"
@@ -36,6 +71,8 @@ class ConfigEnvironment(Enum):
 class IConfigFactory(ABC):
     """Interface for configuration factories"""
     
+    __slots__ = ()
+    
     @abstractmethod
     def create_config(self, config_type: str, **kwargs) -> BaseConfig:
         """Create configuration instance"""
@@ -49,6 +86,8 @@ class IConfigFactory(ABC):
 class IConfigBuilder(ABC):
     """Interface for configuration builders"""
     
+    __slots__ = ()
+    
     @abstractmethod
     def with_validator(self, validator: IConfigValidator) -> 'IConfigBuilder':
         """Add validator to configuration"""
@@ -77,9 +116,11 @@ class IConfigBuilder(ABC):
 class ConfigFactory(IConfigFactory):
     """Configuration factory implementation"""
     
+    __slots__ = ('_config_types', '_logger')
+    
     def __init__(self):
         self._config_types: Dict[str, Type[BaseConfig]] = {}
-        self._logger = logging.getLogger(__name__)
+        self._logger = _logger
     
     def create_config(self, config_type: str, **kwargs) -> BaseConfig:
         """Create configuration instance"""
@@ -90,7 +131,7 @@ class ConfigFactory(IConfigFactory):
         try:
             return config_class(**kwargs)
         except Exception as e:
-            self._logger.error(f"Failed to create config '{config_type}': {e}")
+            self._logger.error("Failed to create config '%s': %s", config_type, e)
             raise ConfigException(f"Failed to create config '{config_type}': {e}")
     
     def register_config_type(self, config_type: str, config_class: Type[BaseConfig]) -> None:
@@ -99,11 +140,15 @@ class ConfigFactory(IConfigFactory):
             raise ConfigException(f"Config class must inherit from BaseConfig")
         
         self._config_types[config_type] = config_class
-        self._logger.debug(f"Registered config type: {config_type}")
+        self._logger.debug("Registered config type: %s", config_type)
 
 class ConfigBuilder(IConfigBuilder):
     """Configuration builder implementation"""
     
+    __slots__ = (
+        '_config_class', '_validator', '_loader', '_cache', '_encryption', '_serializer'
+    )
+    
     def __init__(self, config_class: Type[BaseConfig]):
         self._config_class = config_class
         self._validator: Optional[IConfigValidator] = None
@@ -150,40 +195,61 @@ class ConfigBuilder(IConfigBuilder):
 class ConfigContainer:
     """Dependency injection container for configurations"""
     
+    __slots__ = ('_registry', '_instances', '_lock')
+    
     def __init__(self):
-        self._services: Dict[str, Any] = {}
-        self._singletons: Dict[str, Any] = {}
-        self._factories: Dict[str, Callable] = {}
+        # name -> ('singleton', instance) or ('factory', callable)
+        self._registry: Dict[str, Tuple[str, Any]] = {}
+        # Factory-built instances, reclaimed once nothing else references them
+        self._instances: WeakValueDictionary = WeakValueDictionary()
         self._lock = threading.Lock()
     
     def register_singleton(self, name: str, instance: Any) -> None:
         """Register singleton service"""
         with self._lock:
-            self._singletons[name] = instance
+            self._registry[name] = ('singleton', instance)
+            self._instances.pop(name, None)
     
     def register_factory(self, name: str, factory: Callable) -> None:
         """Register factory function"""
         with self._lock:
-            self._factories[name] = factory
+            self._registry[name] = ('factory', factory)
+            self._instances.pop(name, None)
     
     def get(self, name: str) -> Any:
         """Get service instance"""
+        # Resolved services are read without locking
+        entry = self._registry.get(name)
+        if entry is not None and entry[0] == 'singleton':
+            return entry[1]
+        instance = self._instances.get(name)
+        if instance is not None:
+            return instance
+        
         with self._lock:
-            # Check singletons first
-            if name in self._singletons:
-                return self._singletons[name]
+            # Re-check: another thread may have built it while we waited
+            entry = self._registry.get(name)
+            if entry is None:
+                raise ConfigException(f"Service '{name}' not found")
             
-            # Check factories
-            if name in self._factories:
-                instance = self._factories[name]()
-                self._singletons[name] = instance  # Cache as singleton
+            kind, payload = entry
+            if kind == 'singleton':
+                return payload
+            instance = self._instances.get(name)
+            if instance is not None:
                 return instance
             
-            raise ConfigException(f"Service '{name}' not found")
+            instance = payload()
+            try:
+                self._instances[name] = instance
+            except TypeError:
+                # Not weak-referenceable (e.g. dict, str): cache it strongly
+                self._registry[name] = ('singleton', instance)
+            return instance
     
     def has(self, name: str) -> bool:
         """Check if service exists"""
-        return name in self._singletons or name in self._factories
+        return name in self._registry
 
 class ConfigManager:
     """
@@ -215,38 +281,67 @@ class ConfigManager:
         if hasattr(self, '_initialized'):
             return
         
+        # Replaced, never mutated, under self._lock; readers need no lock
         self._configs: Dict[str, BaseConfig] = {}
+        self._configs_view: Mapping[str, BaseConfig] = MappingProxyType(self._configs)
+        self._names_snapshot: Tuple[str, ...] = ()
+        # Bound methods of the current registry dict, refreshed on every rebind
+        self._configs_contains: Callable[[str], bool] = self._configs.__contains__
         self._factory = ConfigFactory()
         self._container = ConfigContainer()
-        self._observers: List[IConfigObserver] = []
+        # Insertion-ordered set: O(1) membership and removal
+        self._observers: Dict[IConfigObserver, None] = {}
         self._strategy = ConfigStrategy.LAZY
         self._environment = ConfigEnvironment.DEVELOPMENT
-        self._logger = logging.getLogger(__name__)
+        self._logger = _logger
         self._config_paths: Dict[str, str] = {}
         self._auto_reload = False
         self._reload_interval = 60  # seconds
         self._last_reload = datetime.now()
+        self._last_reload_monotonic = time.monotonic()
         self._lock = threading.RLock()
+        # Bumped whenever the set of registered configs changes
+        self._generation = 0
+        # config_name -> (config, config version, estimated bytes)
+        self._size_cache: Dict[str, Tuple[BaseConfig, int, int]] = {}
+        # Flat (config, key) -> value overrides per environment file, and the
+        # values they replaced so the active overlay can be reverted
+        self._env_overlays: Dict[Tuple[str, Optional[int]], Dict[Tuple[str, str], Any]] = {}
+        self._overlay_originals: Dict[Tuple[str, str], Any] = {}
+        self._base_config_dir: Optional[str] = None
+        # Deep backups of the base configs as built, restored on re-initialization
+        self._base_backups: Dict[str, Dict[str, Any]] = {}
         self._initialized = True
     
     # Configuration Management
+    def _publish_configs(self, configs: Dict[str, BaseConfig]) -> None:
+        """Install a new registry dict and refresh the read-only snapshots (call under lock)"""
+        self._configs = configs
+        self._configs_view = MappingProxyType(configs)
+        self._names_snapshot = tuple(configs)
+        self._configs_contains = configs.__contains__
+        self._generation += 1
+    
     def register_config(self, name: str, config: BaseConfig, auto_load: bool = True) -> None:
         """Register a configuration"""
         with self._lock:
             if name in self._configs:
-                self._logger.warning(f"Config '{name}' already registered, overwriting")
+                self._logger.warning("Config '%s' already registered, overwriting", name)
             
-            self._configs[name] = config
+            # Copy-on-write: readers always see a complete dict without locking
+            configs = dict(self._configs)
+            configs[name] = config
+            self._publish_configs(configs)
             
             if auto_load and self._strategy == ConfigStrategy.EAGER:
                 try:
                     config.load()
                     config.validate()
                 except Exception as e:
-                    self._logger.error(f"Failed to load config '{name}': {e}")
+                    self._logger.error("Failed to load config '%s': %s", name, e)
                     raise
             
-            self._logger.info(f"Registered config: {name}")
+            self._logger.info("Registered config: %s", name)
     
     def register_config_type(self, config_type: str, config_class: Type[BaseConfig]) -> None:
         """Register configuration type in factory"""
@@ -260,19 +355,23 @@ class ConfigManager:
     
     def get_config(self, name: str) -> BaseConfig:
         """Get configuration by name"""
+        # Fast path: loaded configs are returned without taking the lock
+        config = self._configs.get(name)
+        if config is not None and (config.is_loaded() or self._strategy != ConfigStrategy.LAZY):
+            return config
+        
         with self._lock:
-            if name not in self._configs:
+            config = self._configs.get(name)
+            if config is None:
                 raise ConfigException(f"Config '{name}' not found")
             
-            config = self._configs[name]
-            
             # Lazy loading
             if self._strategy == ConfigStrategy.LAZY and not config.is_loaded():
                 try:
                     config.load()
                     config.validate()
                 except Exception as e:
-                    self._logger.error(f"Failed to lazy load config '{name}': {e}")
+                    self._logger.error("Failed to lazy load config '%s': %s", name, e)
                     raise
             
             return config
@@ -283,7 +382,7 @@ class ConfigManager:
             config = self.get_config(config_name)
             return config.get(key, default)
         except Exception as e:
-            self._logger.error(f"Failed to get config value '{config_name}.{key}': {e}")
+            self._logger.error("Failed to get config value '%s.%s': %s", config_name, key, e)
             return default
     
     def set_config_value(self, config_name: str, key: str, value: Any) -> None:
@@ -293,24 +392,30 @@ class ConfigManager:
     
     def has_config(self, name: str) -> bool:
         """Check if configuration exists"""
-        return name in self._configs
+        return self._configs_contains(name)
     
     def remove_config(self, name: str) -> None:
         """Remove configuration"""
         with self._lock:
             if name in self._configs:
-                del self._configs[name]
+                configs = dict(self._configs)
+                del configs[name]
+                self._publish_configs(configs)
                 if name in self._config_paths:
                     del self._config_paths[name]
-                self._logger.info(f"Removed config: {name}")
+                self._logger.info("Removed config: %s", name)
     
-    def get_all_configs(self) -> Dict[str, BaseConfig]:
-        """Get all configurations"""
-        return self._configs.copy()
+    def get_all_configs(self) -> Mapping[str, BaseConfig]:
+        """Get a read-only view of all configurations
+        
+        The view is a snapshot: later registrations replace the underlying
+        dict rather than modifying it.
+        """
+        return self._configs_view
     
-    def get_config_names(self) -> List[str]:
-        """Get all configuration names"""
-        return list(self._configs.keys())
+    def get_config_names(self) -> Tuple[str, ...]:
+        """Get all configuration names as an immutable snapshot"""
+        return self._names_snapshot
     
     # Builder Pattern
     def builder(self, config_class: Type[BaseConfig]) -> ConfigBuilder:
@@ -321,7 +426,7 @@ class ConfigManager:
     def set_environment(self, environment: ConfigEnvironment) -> None:
         """Set current environment"""
         self._environment = environment
-        self._logger.info(f"Environment set to: {environment.value}")
+        self._logger.info("Environment set to: %s", environment.value)
     
     def get_environment(self) -> ConfigEnvironment:
         """Get current environment"""
@@ -329,30 +434,108 @@ class ConfigManager:
     
     def load_environment_configs(self, config_dir: str) -> None:
         """Load environment-specific configurations"""
-        config_path = Path(config_dir)
-        env_file = config_path / f"{self._environment.value}.json"
+        self._apply_overlay(self._get_environment_overlay(config_dir, self._environment))
+    
+    def switch_environment(self, environment: ConfigEnvironment, config_dir: str) -> None:
+        """Switch environment by swapping overlays, touching only overridden keys"""
+        with self._lock:
+            self._revert_overlay()
+            self.set_environment(environment)
+            self.load_environment_configs(config_dir)
+    
+    def set_base_configs(self, configs: Dict[str, BaseConfig], config_dir: str) -> None:
+        """Register freshly built configs as the base set for config_dir
+        
+        A deep backup of each config is kept so reset_to_base() can return to
+        this state later.
+        """
+        with self._lock:
+            # Overrides recorded against previously registered configs no longer apply
+            self._overlay_originals.clear()
+            for name, config in configs.items():
+                self.register_config(name, config, auto_load=False)
+            self._base_backups = {name: config.backup_deep() for name, config in configs.items()}
+            self._base_config_dir = config_dir
+    
+    def reset_to_base(self, config_dir: str) -> bool:
+        """Reset every base config to its state right after it was built
+        
+        Returns False, leaving everything untouched, when the base set was
+        not built from config_dir.
+        """
+        with self._lock:
+            if self._base_config_dir != config_dir:
+                return False
+            for config_name, backup in self._base_backups.items():
+                config = self._configs.get(config_name)
+                if config is not None:
+                    config.restore(copy.deepcopy(backup))
+            # The restored data carries no overrides, so there is nothing to revert
+            self._overlay_originals.clear()
+            return True
+    
+    def _get_environment_overlay(self, config_dir: str, environment: ConfigEnvironment) -> Dict[Tuple[str, str], Any]:
+        """Read and flatten an environment file once, then reuse it"""
+        env_file = Path(config_dir) / f"{environment.value}.json"
+        try:
+            mtime_ns = env_file.stat().st_mtime_ns
+        except OSError:
+            mtime_ns = None
+        
+        # Reparse only when the file changed (or appeared/disappeared)
+        cache_key = (str(env_file), mtime_ns)
+        overlay = self._env_overlays.get(cache_key)
+        if overlay is not None:
+            return overlay
         
-        if env_file.exists():
+        overlay = {}
+        if mtime_ns is not None:
             try:
-                with open(env_file, 'r') as f:
-                    env_configs = json.load(f)
+                raw = env_file.read_bytes()
+                env_configs = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
                 
                 for config_name, config_data in env_configs.items():
-                    if config_name in self._configs:
-                        config = self._configs[config_name]
-                        for key, value in config_data.items():
-                            config.set(key, value)
-                
-                self._logger.info(f"Loaded environment configs from: {env_file}")
+                    for key, value in config_data.items():
+                        overlay[(config_name, key)] = value
             except Exception as e:
-                self._logger.error(f"Failed to load environment configs: {e}")
+                self._logger.error("Failed to load environment configs: %s", e)
                 raise ConfigLoadError(f"Failed to load environment configs: {e}")
+        
+        self._env_overlays[cache_key] = overlay
+        if len(self._env_overlays) > 8:
+            del self._env_overlays[next(iter(self._env_overlays))]
+        return overlay
+    
+    def _apply_overlay(self, overlay: Dict[Tuple[str, str], Any]) -> None:
+        """Apply flat overrides, remembering the first value each one replaced"""
+        for (config_name, key), value in overlay.items():
+            config = self._configs.get(config_name)
+            if config is None:
+                continue
+            if (config_name, key) not in self._overlay_originals:
+                self._overlay_originals[(config_name, key)] = config.get(key, _MISSING)
+            config.set(key, value)
+        
+        if overlay:
+            self._logger.info("Applied %s environment overrides for: %s", len(overlay), self._environment.value)
+    
+    def _revert_overlay(self) -> None:
+        """Restore the values replaced by the active overlay"""
+        for (config_name, key), original in self._overlay_originals.items():
+            config = self._configs.get(config_name)
+            if config is None:
+                continue
+            if original is _MISSING:
+                config.remove_key(key)
+            else:
+                config.set(key, original)
+        self._overlay_originals.clear()
     
     # Strategy Pattern
     def set_loading_strategy(self, strategy: ConfigStrategy) -> None:
         """Set configuration loading strategy"""
         self._strategy = strategy
-        self._logger.info(f"Loading strategy set to: {strategy.value}")
+        self._logger.info("Loading strategy set to: %s", strategy.value)
     
     def get_loading_strategy(self) -> ConfigStrategy:
         """Get current loading strategy"""
@@ -389,7 +572,7 @@ class ConfigManager:
                     errors.append(f"Validation error for config '{name}': {e}")
             
             if errors:
-                self._logger.error(f"Configuration validation errors: {errors}")
+                self._logger.error("Configuration validation errors: %s", errors)
                 return False
             
             self._logger.info("All configurations validated successfully")
@@ -401,11 +584,12 @@ class ConfigManager:
             for name, config in self._configs.items():
                 try:
                     config.reload()
-                    self._logger.debug(f"Reloaded config: {name}")
+                    self._logger.debug("Reloaded config: %s", name)
                 except Exception as e:
-                    self._logger.error(f"Failed to reload config '{name}': {e}")
+                    self._logger.error("Failed to reload config '%s': %s", name, e)
             
             self._last_reload = datetime.now()
+            self._last_reload_monotonic = time.monotonic()
             self._logger.info("All configurations reloaded")
     
     # Hot Reloading
@@ -413,7 +597,7 @@ class ConfigManager:
         """Enable automatic configuration reloading"""
         self._auto_reload = True
         self._reload_interval = interval
-        self._logger.info(f"Auto-reload enabled with interval: {interval}s")
+        self._logger.info("Auto-reload enabled with interval: %ss", interval)
     
     def disable_auto_reload(self) -> None:
         """Disable automatic configuration reloading"""
@@ -425,17 +609,19 @@ class ConfigManager:
         if not self._auto_reload:
             return
         
-        now = datetime.now()
-        if (now - self._last_reload).seconds >= self._reload_interval:
+        # Monotonic clock: immune to wall-clock jumps and cheaper than datetime math
+        if time.monotonic() - self._last_reload_monotonic >= self._reload_interval:
             try:
                 self.reload_all()
             except Exception as e:
-                self._logger.error(f"Auto-reload failed: {e}")
+                self._logger.error("Auto-reload failed: %s", e)
     
     # Observer Pattern
     def add_global_observer(self, observer: IConfigObserver) -> None:
         """Add global configuration observer"""
-        self._observers.append(observer)
+        if observer in self._observers:
+            return
+        self._observers[observer] = None
         
         # Add to all existing configs
         for config in self._configs.values():
@@ -443,8 +629,7 @@ class ConfigManager:
     
     def remove_global_observer(self, observer: IConfigObserver) -> None:
         """Remove global configuration observer"""
-        if observer in self._observers:
-            self._observers.remove(observer)
+        self._observers.pop(observer, None)
         
         # Remove from all existing configs
         for config in self._configs.values():
@@ -464,21 +649,29 @@ class ConfigManager:
         return self._container.get(name)
     
     # Configuration Backup and Restore
-    def backup_all(self) -> Dict[str, Any]:
-        """Create backup of all configurations"""
-        backup = {
+    def _backup_header(self) -> Dict[str, Any]:
+        """Backup metadata written ahead of the per-config entries"""
+        return {
             'timestamp': datetime.now().isoformat(),
             'environment': self._environment.value,
             'strategy': self._strategy.value,
-            'configs': {}
         }
-        
+    
+    def _iter_config_backups(self):
+        """Yield (name, backup) per loaded config, skipping configs that fail to back up"""
         for name, config in self._configs.items():
+            # Unloaded configs hold no data worth restoring; skip them without a try
+            if not config.is_loaded():
+                continue
             try:
-                backup['configs'][name] = config.backup()
+                yield name, config.backup()
             except Exception as e:
-                self._logger.error(f"Failed to backup config '{name}': {e}")
-        
+                self._logger.error("Failed to backup config '%s': %s", name, e)
+    
+    def backup_all(self) -> Dict[str, Any]:
+        """Create backup of all configurations"""
+        backup = self._backup_header()
+        backup['configs'] = dict(self._iter_config_backups())
         return backup
     
     def restore_all(self, backup: Dict[str, Any]) -> None:
@@ -486,62 +679,85 @@ class ConfigManager:
         if 'configs' not in backup:
             raise ConfigException("Invalid backup format")
         
+        restored = []
         for name, config_backup in backup['configs'].items():
             if name in self._configs:
                 try:
                     self._configs[name].restore(config_backup)
+                    restored.append(name)
                 except Exception as e:
-                    self._logger.error(f"Failed to restore config '{name}': {e}")
+                    self._logger.error("Failed to restore config '%s': %s", name, e)
+        
+        for observer in self._observers:
+            try:
+                observer.on_configs_restored(restored)
+            except Exception as e:
+                self._logger.error("Error notifying observer: %s", e)
     
     # Health and Monitoring
-    def get_health_status(self) -> Dict[str, Any]:
-        """Get configuration system health status"""
+    def get_health_status(self, detailed: bool = True) -> Dict[str, Any]:
+        """Get configuration system health status
+        
+        Args:
+            detailed: Include the per-config breakdown; aggregates only when False
+        """
+        configs = self._configs
+        loaded = validated = 0
+        per_config = {}
+        # One pass; key counts come from len() of the data dict, no key list copies
+        for name, config in configs.items():
+            is_loaded = config.is_loaded()
+            is_validated = config.is_validated()
+            loaded += is_loaded
+            validated += is_validated
+            if detailed:
+                per_config[name] = {
+                    'loaded': is_loaded,
+                    'validated': is_validated,
+                    'keys_count': len(config._data) if is_loaded else 0
+                }
+        
         status = {
-            'total_configs': len(self._configs),
-            'loaded_configs': sum(1 for c in self._configs.values() if c.is_loaded()),
-            'validated_configs': sum(1 for c in self._configs.values() if c.is_validated()),
+            'total_configs': len(configs),
+            'loaded_configs': loaded,
+            'validated_configs': validated,
             'environment': self._environment.value,
             'strategy': self._strategy.value,
             'auto_reload': self._auto_reload,
             'last_reload': self._last_reload.isoformat(),
-            'configs': {}
         }
-        
-        for name, config in self._configs.items():
-            status['configs'][name] = {
-                'loaded': config.is_loaded(),
-                'validated': config.is_validated(),
-                'keys_count': len(config.get_all_keys()) if config.is_loaded() else 0
-            }
+        if detailed:
+            status['configs'] = per_config
         
         return status
     
     def get_statistics(self) -> Dict[str, Any]:
         """Get configuration statistics"""
-        total_keys = 0
-        config_sizes = {}
-        
-        for name, config in self._configs.items():
-            if config.is_loaded():
-                keys = config.get_all_keys()
-                config_sizes[name] = len(keys)
-                total_keys += len(keys)
+        configs = self._configs
+        config_sizes = {name: len(config._data) for name, config in configs.items() if config.is_loaded()}
+        total_keys = sum(config_sizes.values())
         
         return {
-            'total_configurations': len(self._configs),
+            'total_configurations': len(configs),
             'total_keys': total_keys,
-            'average_keys_per_config': total_keys / len(self._configs) if self._configs else 0,
+            'average_keys_per_config': total_keys / len(configs) if configs else 0,
             'config_sizes': config_sizes,
             'memory_usage': self._estimate_memory_usage()
         }
     
     def _estimate_memory_usage(self) -> str:
         """Estimate memory usage of configurations"""
-        # Simple estimation based on string representation
+        # Sizes are measured once per config version and reused until it changes
         total_size = 0
-        for config in self._configs.values():
+        size_cache = {}
+        for name, config in self._configs.items():
             if config.is_loaded():
-                total_size += len(str(config))
+                entry = self._size_cache.get(name)
+                if entry is None or entry[0] is not config or entry[1] != config._version:
+                    entry = (config, config._version, _deep_getsizeof(config._data))
+                size_cache[name] = entry
+                total_size += entry[2]
+        self._size_cache = size_cache
         
         if total_size < 1024:
             return f"{total_size} bytes"
@@ -554,43 +770,68 @@ class ConfigManager:
     def clear_all(self) -> None:
         """Clear all configurations"""
         with self._lock:
-            self._configs.clear()
+            self._publish_configs({})
             self._config_paths.clear()
+            self._overlay_originals.clear()
+            self._base_config_dir = None
+            self._base_backups.clear()
             self._logger.info("All configurations cleared")
     
+    @staticmethod
+    def _dump_json(data: Any) -> str:
+        """Serialize with the same layout as json.dumps(indent=2, default=str)"""
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(
+                data, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            ).decode('utf-8')
+        return json.dumps(data, indent=2, default=str)
+    
     def export_to_file(self, filepath: str, format: str = 'json') -> None:
         """Export all configurations to file"""
-        backup = self.backup_all()
-        
         try:
-            with open(filepath, 'w') as f:
-                if format.lower() == 'json':
-                    json.dump(backup, f, indent=2, default=str)
-                elif format.lower() == 'yaml':
-                    yaml.dump(backup, f, default_flow_style=False)
-                else:
-                    raise ConfigException(f"Unsupported format: {format}")
+            if format.lower() == 'json':
+                # Stream one config at a time instead of building the whole backup first
+                with open(filepath, 'w', encoding='utf-8') as f:
+                    f.write('{')
+                    for key, value in self._backup_header().items():
+                        f.write(f'\n  {json.dumps(key)}: {self._dump_json(value)},')
+                    f.write('\n  "configs": {')
+                    first = True
+                    for name, config_backup in self._iter_config_backups():
+                        f.write('\n    ' if first else ',\n    ')
+                        first = False
+                        f.write(f'{json.dumps(name)}: ')
+                        f.write(self._dump_json(config_backup).replace('\n', '\n    '))
+                    f.write('}' if first else '\n  }')
+                    f.write('\n}')
+            elif format.lower() == 'yaml':
+                backup = self.backup_all()
+                with open(filepath, 'w') as f:
+                    yaml.dump(backup, f, Dumper=_YamlDumper, default_flow_style=False)
+            else:
+                raise ConfigException(f"Unsupported format: {format}")
             
-            self._logger.info(f"Configurations exported to: {filepath}")
+            self._logger.info("Configurations exported to: %s", filepath)
         except Exception as e:
-            self._logger.error(f"Failed to export configurations: {e}")
+            self._logger.error("Failed to export configurations: %s", e)
             raise
     
     def import_from_file(self, filepath: str, format: str = 'json') -> None:
         """Import configurations from file"""
         try:
-            with open(filepath, 'r') as f:
-                if format.lower() == 'json':
-                    backup = json.load(f)
-                elif format.lower() == 'yaml':
-                    backup = yaml.safe_load(f)
-                else:
-                    raise ConfigException(f"Unsupported format: {format}")
+            if format.lower() == 'json':
+                raw = Path(filepath).read_bytes()
+                backup = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+            elif format.lower() == 'yaml':
+                with open(filepath, 'r') as f:
+                    backup = yaml.load(f, Loader=_YamlSafeLoader)
+            else:
+                raise ConfigException(f"Unsupported format: {format}")
             
             self.restore_all(backup)
-            self._logger.info(f"Configurations imported from: {filepath}")
+            self._logger.info("Configurations imported from: %s", filepath)
         except Exception as e:
-            self._logger.error(f"Failed to import configurations: {e}")
+            self._logger.error("Failed to import configurations: %s", e)
             raise
     
     def __str__(self) -> str:
@@ -4,17 +4,165 @@ Memuat dan mengelola konfigurasi environment variables
 """
 
 import os
+import re
 import sys
+import io
+import json
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
-from dotenv import load_dotenv
+from functools import lru_cache
+from typing import Any, Dict, List, Mapping, Optional, Tuple, Union
+from dotenv import load_dotenv, dotenv_values
 import logging
 
 logger = logging.getLogger(__name__)
 
+def _read_env_values(env_file: str) -> Optional[Dict[str, Optional[str]]]:
+    """
+    Membaca isi file .env dengan satu kali baca file
+    
+    Returns:
+        Dict key -> value, atau None jika file memakai interpolasi ${VAR}
+        (biar load_dotenv yang menanganinya)
+    """
+    with open(env_file, 'r', encoding='utf-8') as f:
+        text = f.read()
+    if '$' in text:
+        return None
+    return dict(dotenv_values(stream=io.StringIO(text)))
+
+# Konversi nilai mentah environment; None berarti variabel tidak di-set
+def _to_int(value: Optional[str], default: int) -> int:
+    if value is None:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        return default
+
+_LIST_SPLIT = re.compile(r'\s*,\s*')
+_LIST_ITEM_STRIP = ' \t"\''
+
+_TRUE_VALUES = frozenset(('true', '1', 'yes', 'on', 't', 'y'))
+_FALSE_VALUES = frozenset(('false', '0', 'no', 'off', 'f', 'n'))
+
+def _to_bool(value: Optional[str], default: bool) -> bool:
+    if value is None:
+        return default
+    value = value.lower()
+    if value in _TRUE_VALUES:
+        return True
+    if value in _FALSE_VALUES:
+        return False
+    return default
+
+def _to_list(value: Optional[str], default: List[str]) -> List[str]:
+    # Selalu salinan, supaya default yang dipakai bersama tidak ikut termutasi
+    if not value:
+        return list(default)
+    
+    # Handle JSON-like format atau comma-separated
+    value = value.strip()
+    if value[:1] == '[' and value[-1:] == ']':
+        try:
+            return json.loads(value)
+        except json.JSONDecodeError:
+            pass
+    
+    # Comma-separated values; item kosong dibuang
+    return [item for item in (part.strip(_LIST_ITEM_STRIP) for part in _LIST_SPLIT.split(value)) if item]
+
+# (key, default, konversi) untuk setiap konfigurasi yang dimuat _load_config;
+# konversi None berarti nilai string dipakai apa adanya
+_CONFIG_SPEC = (
+    # Application Settings
+    ('APP_NAME', 'BK API Server', None),
+    ('APP_VERSION', '1.0.0', None),
+    ('DEBUG', False, _to_bool),
+    ('SECRET_KEY', 'change-this-secret-key', None),
+    # Server Configuration
+    ('HOST', '0.0.0.0', None),
+    ('PORT', 8000, _to_int),
+    ('RELOAD', True, _to_bool),
+    # Database Configuration
+    ('DATABASE_URL', 'sqlite:///./bk_database.db', None),
+    # Redis Configuration
+    ('REDIS_URL', 'redis://localhost:6379/0', None),
+    ('REDIS_PASSWORD', '', None),
+    ('REDIS_DB', 0, _to_int),
+    # JWT Configuration
+    ('JWT_SECRET_KEY', 'jwt-secret-key', None),
+    ('JWT_ALGORITHM', 'HS256', None),
+    ('JWT_ACCESS_TOKEN_EXPIRE_MINUTES', 30, _to_int),
+    ('JWT_REFRESH_TOKEN_EXPIRE_DAYS', 7, _to_int),
+    # Email Configuration
+    ('SMTP_HOST', 'smtp.gmail.com', None),
+    ('SMTP_PORT', 587, _to_int),
+    ('SMTP_USER', '', None),
+    ('SMTP_PASSWORD', '', None),
+    ('EMAIL_FROM', 'noreply@bk-api.com', None),
+    # External API Keys
+    ('MIDTRANS_SERVER_KEY', '', None),
+    ('MIDTRANS_CLIENT_KEY', '', None),
+    ('MIDTRANS_IS_PRODUCTION', False, _to_bool),
+    ('XENDIT_SECRET_KEY', '', None),
+    ('XENDIT_WEBHOOK_TOKEN', '', None),
+    # Notification Services
+    ('FIREBASE_SERVER_KEY', '', None),
+    ('ONESIGNAL_APP_ID', '', None),
+    ('ONESIGNAL_REST_API_KEY', '', None),
+    # Logging Configuration
+    ('LOG_LEVEL', 'INFO', None),
+    ('LOG_FILE', 'logs/bk-api.log', None),
+    ('LOG_MAX_SIZE', 10485760, _to_int),
+    ('LOG_BACKUP_COUNT', 5, _to_int),
+    # Security Settings
+    ('CORS_ORIGINS', ['http://localhost:3000'], _to_list),
+    ('ALLOWED_HOSTS', ['localhost', '127.0.0.1'], _to_list),
+    # Rate Limiting
+    ('RATE_LIMIT_PER_MINUTE', 60, _to_int),
+    ('RATE_LIMIT_BURST', 10, _to_int),
+    # Cache Settings
+    ('CACHE_TTL', 300, _to_int),
+    ('CACHE_MAX_SIZE', 1000, _to_int),
+    # File Upload Settings
+    ('MAX_FILE_SIZE', 5242880, _to_int),
+    ('ALLOWED_FILE_TYPES', ['jpg', 'jpeg', 'png', 'pdf'], _to_list),
+    ('UPLOAD_DIR', 'uploads/', None),
+    # Monitoring
+    ('ENABLE_METRICS', True, _to_bool),
+    ('METRICS_PORT', 9090, _to_int),
+)
+
+_CONFIG_KEYS = tuple(key for key, _, _ in _CONFIG_SPEC)
+
+@lru_cache(maxsize=4)
+def _build_config(raw_values: Tuple[Optional[str], ...]) -> Dict[str, Any]:
+    """
+    Membangun dict konfigurasi dari nilai mentah (urutan sesuai _CONFIG_SPEC)
+    
+    Di-cache per tuple nilai mentah, jadi environment yang sama tidak dikonversi ulang.
+    Hasilnya dipakai bersama; jangan dimutasi langsung.
+    """
+    config = {}
+    for (key, default, cast), value in zip(_CONFIG_SPEC, raw_values):
+        if cast is None:
+            config[key] = default if value is None else value
+        else:
+            config[key] = cast(value, default)
+    return config
+
+# Key yang nilainya disembunyikan di print_config_summary
+_SENSITIVE_KEYS = frozenset((
+    'SECRET_KEY', 'JWT_SECRET_KEY', 'SMTP_PASSWORD', 'REDIS_PASSWORD',
+    'MIDTRANS_SERVER_KEY', 'XENDIT_SECRET_KEY', 'XENDIT_WEBHOOK_TOKEN',
+    'FIREBASE_SERVER_KEY', 'ONESIGNAL_REST_API_KEY',
+))
+
 class EnvironmentLoader:
     """Class untuk memuat dan mengelola environment variables"""
     
+    __slots__ = ('env_file', 'config')
+    
     def __init__(self, env_file: Optional[str] = None):
         """
         Inisialisasi environment loader
@@ -41,161 +189,63 @@ class EnvironmentLoader:
     def load_environment(self) -> None:
         """Memuat environment variables dari file .env"""
         try:
+            source: Mapping[str, str] = os.environ
             if self.env_file and os.path.exists(self.env_file):
-                load_dotenv(self.env_file)
+                values = _read_env_values(self.env_file)
+                if values is None:
+                    load_dotenv(self.env_file)
+                else:
+                    # Sama seperti load_dotenv(override=False): env sistem tetap diutamakan
+                    merged = {key: value for key, value in values.items() if value is not None}
+                    merged.update(os.environ)
+                    environ = os.environ
+                    for key, value in values.items():
+                        if value is not None and key not in environ:
+                            environ[key] = value
+                    # _load_config membaca dari dict biasa, bukan lookup os.environ per key
+                    source = merged
                 logger.info(f"✅ Environment file dimuat: {self.env_file}")
             else:
                 logger.warning("⚠️  File .env tidak ditemukan, menggunakan environment variables sistem")
             
             # Load semua environment variables
-            self._load_config()
+            self._load_config(source)
             
         except Exception as e:
             logger.error(f"❌ Error memuat environment: {e}")
             raise
     
-    def _load_config(self) -> None:
-        """Memuat konfigurasi dari environment variables"""
-        
-        # Application Settings
-        self.config.update({
-            'APP_NAME': self.get('APP_NAME', 'BK API Server'),
-            'APP_VERSION': self.get('APP_VERSION', '1.0.0'),
-            'DEBUG': self.get_bool('DEBUG', False),
-            'SECRET_KEY': self.get('SECRET_KEY', 'change-this-secret-key'),
-        })
-        
-        # Server Configuration
-        self.config.update({
-            'HOST': self.get('HOST', '0.0.0.0'),
-            'PORT': self.get_int('PORT', 8000),
-            'RELOAD': self.get_bool('RELOAD', True),
-        })
-        
-        # Database Configuration
-        self.config.update({
-            'DATABASE_URL': self.get('DATABASE_URL', 'sqlite:///./bk_database.db'),
-        })
-        
-        # Redis Configuration
-        self.config.update({
-            'REDIS_URL': self.get('REDIS_URL', 'redis://localhost:6379/0'),
-            'REDIS_PASSWORD': self.get('REDIS_PASSWORD', ''),
-            'REDIS_DB': self.get_int('REDIS_DB', 0),
-        })
-        
-        # JWT Configuration
-        self.config.update({
-            'JWT_SECRET_KEY': self.get('JWT_SECRET_KEY', 'jwt-secret-key'),
-            'JWT_ALGORITHM': self.get('JWT_ALGORITHM', 'HS256'),
-            'JWT_ACCESS_TOKEN_EXPIRE_MINUTES': self.get_int('JWT_ACCESS_TOKEN_EXPIRE_MINUTES', 30),
-            'JWT_REFRESH_TOKEN_EXPIRE_DAYS': self.get_int('JWT_REFRESH_TOKEN_EXPIRE_DAYS', 7),
-        })
-        
-        # Email Configuration
-        self.config.update({
-            'SMTP_HOST': self.get('SMTP_HOST', 'smtp.gmail.com'),
-            'SMTP_PORT': self.get_int('SMTP_PORT', 587),
-            'SMTP_USER': self.get('SMTP_USER', ''),
-            'SMTP_PASSWORD': self.get('SMTP_PASSWORD', ''),
-            'EMAIL_FROM': self.get('EMAIL_FROM', 'noreply@bk-api.com'),
-        })
-        
-        # External API Keys
-        self.config.update({
-            'MIDTRANS_SERVER_KEY': self.get('MIDTRANS_SERVER_KEY', ''),
-            'MIDTRANS_CLIENT_KEY': self.get('MIDTRANS_CLIENT_KEY', ''),
-            'MIDTRANS_IS_PRODUCTION': self.get_bool('MIDTRANS_IS_PRODUCTION', False),
-            'XENDIT_SECRET_KEY': self.get('XENDIT_SECRET_KEY', ''),
-            'XENDIT_WEBHOOK_TOKEN': self.get('XENDIT_WEBHOOK_TOKEN', ''),
-        })
-        
-        # Notification Services
-        self.config.update({
-            'FIREBASE_SERVER_KEY': self.get('FIREBASE_SERVER_KEY', ''),
-            'ONESIGNAL_APP_ID': self.get('ONESIGNAL_APP_ID', ''),
-            'ONESIGNAL_REST_API_KEY': self.get('ONESIGNAL_REST_API_KEY', ''),
-        })
-        
-        # Logging Configuration
-        self.config.update({
-            'LOG_LEVEL': self.get('LOG_LEVEL', 'INFO'),
-            'LOG_FILE': self.get('LOG_FILE', 'logs/bk-api.log'),
-            'LOG_MAX_SIZE': self.get_int('LOG_MAX_SIZE', 10485760),
-            'LOG_BACKUP_COUNT': self.get_int('LOG_BACKUP_COUNT', 5),
-        })
-        
-        # Security Settings
-        self.config.update({
-            'CORS_ORIGINS': self.get_list('CORS_ORIGINS', ['http://localhost:3000']),
-            'ALLOWED_HOSTS': self.get_list('ALLOWED_HOSTS', ['localhost', '127.0.0.1']),
-        })
-        
-        # Rate Limiting
-        self.config.update({
-            'RATE_LIMIT_PER_MINUTE': self.get_int('RATE_LIMIT_PER_MINUTE', 60),
-            'RATE_LIMIT_BURST': self.get_int('RATE_LIMIT_BURST', 10),
-        })
-        
-        # Cache Settings
-        self.config.update({
-            'CACHE_TTL': self.get_int('CACHE_TTL', 300),
-            'CACHE_MAX_SIZE': self.get_int('CACHE_MAX_SIZE', 1000),
-        })
-        
-        # File Upload Settings
-        self.config.update({
-            'MAX_FILE_SIZE': self.get_int('MAX_FILE_SIZE', 5242880),
-            'ALLOWED_FILE_TYPES': self.get_list('ALLOWED_FILE_TYPES', ['jpg', 'jpeg', 'png', 'pdf']),
-            'UPLOAD_DIR': self.get('UPLOAD_DIR', 'uploads/'),
-        })
+    def _load_config(self, environ: Optional[Mapping[str, str]] = None) -> None:
+        """
+        Memuat konfigurasi dari environment variables
         
-        # Monitoring
+        Args:
+            environ: Sumber nilai (default: os.environ)
+        """
+        if environ is None:
+            environ = os.environ
+        built = _build_config(tuple(map(environ.get, _CONFIG_KEYS)))
+        # Salin list agar instance tidak berbagi objek mutable lewat cache
         self.config.update({
-            'ENABLE_METRICS': self.get_bool('ENABLE_METRICS', True),
-            'METRICS_PORT': self.get_int('METRICS_PORT', 9090),
+            key: list(value) if type(value) is list else value
+            for key, value in built.items()
         })
     
     def get(self, key: str, default: Any = None) -> str:
         """Mendapatkan environment variable sebagai string"""
-        return os.getenv(key, default)
+        return os.environ.get(key, default)
     
     def get_int(self, key: str, default: int = 0) -> int:
         """Mendapatkan environment variable sebagai integer"""
-        try:
-            value = os.getenv(key)
-            return int(value) if value is not None else default
-        except (ValueError, TypeError):
-            return default
+        return _to_int(os.environ.get(key), default)
     
     def get_bool(self, key: str, default: bool = False) -> bool:
         """Mendapatkan environment variable sebagai boolean"""
-        value = os.getenv(key, '').lower()
-        if value in ('true', '1', 'yes', 'on'):
-            return True
-        elif value in ('false', '0', 'no', 'off'):
-            return False
-        return default
+        return _to_bool(os.environ.get(key), default)
     
     def get_list(self, key: str, default: List[str] = None) -> List[str]:
         """Mendapatkan environment variable sebagai list"""
-        if default is None:
-            default = []
-        
-        value = os.getenv(key)
-        if not value:
-            return default
-        
-        # Handle JSON-like format atau comma-separated
-        if value.startswith('[') and value.endswith(']'):
-            try:
-                import json
-                return json.loads(value)
-            except json.JSONDecodeError:
-                pass
-        
-        # Comma-separated values
-        return [item.strip().strip('"').strip("'") for item in value.split(',')]
+        return _to_list(os.environ.get(key), [] if default is None else default)
     
     def get_config(self, key: str, default: Any = None) -> Any:
         """Mendapatkan konfigurasi yang sudah dimuat"""
@@ -229,43 +279,53 @@ class EnvironmentLoader:
     
     def print_config_summary(self) -> None:
         """Menampilkan ringkasan konfigurasi (tanpa sensitive data)"""
-        sensitive_keys = [
-            'SECRET_KEY', 'JWT_SECRET_KEY', 'SMTP_PASSWORD',
-            'MIDTRANS_SERVER_KEY', 'XENDIT_SECRET_KEY', 'FIREBASE_SERVER_KEY'
-        ]
-        
-        print("\n=== Konfigurasi Environment ===")
+        lines = ["\n=== Konfigurasi Environment ==="]
         for key, value in sorted(self.config.items()):
-            if key in sensitive_keys:
+            if key in _SENSITIVE_KEYS:
                 display_value = "***HIDDEN***" if value else "NOT_SET"
             else:
                 display_value = value
-            print(f"{key}: {display_value}")
-        print("=" * 35)
+            lines.append(f"{key}: {display_value}")
+        lines.append("=" * 35)
+        # Satu kali print untuk seluruh ringkasan
+        print("\n".join(lines))
+
+# Instance global, dibuat saat pertama kali diakses (file .env baru dibaca saat itu)
+_env_loader: Optional[EnvironmentLoader] = None
+
+def _get_loader() -> EnvironmentLoader:
+    """Mendapatkan instance global, membuatnya jika belum ada"""
+    global _env_loader
+    if _env_loader is None:
+        _env_loader = EnvironmentLoader()
+    return _env_loader
 
-# Instance global
-env_loader = EnvironmentLoader()
+def __getattr__(name: str) -> Any:
+    # PEP 562: `from env_loader import env_loader` tetap berfungsi
+    if name == 'env_loader':
+        return _get_loader()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # Fungsi helper untuk akses mudah
 def get_config(key: str, default: Any = None) -> Any:
     """Mendapatkan konfigurasi"""
-    return env_loader.get_config(key, default)
+    return _get_loader().get_config(key, default)
 
 def get_env(key: str, default: Any = None) -> str:
     """Mendapatkan environment variable"""
-    return env_loader.get(key, default)
+    return _get_loader().get(key, default)
 
 def get_env_int(key: str, default: int = 0) -> int:
     """Mendapatkan environment variable sebagai integer"""
-    return env_loader.get_int(key, default)
+    return _get_loader().get_int(key, default)
 
 def get_env_bool(key: str, default: bool = False) -> bool:
     """Mendapatkan environment variable sebagai boolean"""
-    return env_loader.get_bool(key, default)
+    return _get_loader().get_bool(key, default)
 
 def get_env_list(key: str, default: List[str] = None) -> List[str]:
     """Mendapatkan environment variable sebagai list"""
-    return env_loader.get_list(key, default)
+    return _get_loader().get_list(key, default)
 
 # Export
 __all__ = [
@@ -4,13 +4,22 @@ Mengatur semua endpoint dan routing aplikasi
 """
 
 from fastapi import FastAPI
-from typing import List
-import os
+from typing import List, Optional, Tuple
+from types import ModuleType
+from concurrent.futures import ThreadPoolExecutor
 import importlib
+import pkgutil
 import logging
 
 logger = logging.getLogger(__name__)
 
+def _import_route_module(module_name: str) -> Tuple[Optional[ModuleType], Optional[Exception]]:
+    """Import routes.<module_name>; error dikembalikan, bukan di-raise, agar bisa dilaporkan"""
+    try:
+        return importlib.import_module(f"routes.{module_name}"), None
+    except Exception as e:
+        return None, e
+
 def register_routes(app: FastAPI) -> None:
     """
     Mendaftarkan semua routes ke aplikasi FastAPI
@@ -31,12 +40,20 @@ def register_routes(app: FastAPI) -> None:
     
     registered_routes = []
     
-    for module_name in route_modules:
+    # Import semua modul secara paralel; I/O baca file dan unmarshal .pyc tumpang tindih
+    with ThreadPoolExecutor(max_workers=len(route_modules)) as executor:
+        imported = list(executor.map(_import_route_module, route_modules))
+    
+    # Daftarkan secara berurutan agar urutan router tetap sama
+    for module_name, (route_module, error) in zip(route_modules, imported):
+        if isinstance(error, ImportError):
+            logger.warning(f"⚠️  Route {module_name} tidak ditemukan: {error}")
+            continue
+        if error is not None:
+            logger.error(f"❌ Error mendaftarkan route {module_name}: {error}")
+            continue
+        
         try:
-            # Coba import modul route
-            module_path = f"routes.{module_name}"
-            route_module = importlib.import_module(module_path)
-            
             # Cari router dalam modul
             if hasattr(route_module, 'router'):
                 # Include router dengan prefix
@@ -51,8 +68,6 @@ def register_routes(app: FastAPI) -> None:
             else:
                 logger.warning(f"⚠️  Modul {module_name} tidak memiliki router")
                 
-        except ImportError as e:
-            logger.warning(f"⚠️  Route {module_name} tidak ditemukan: {e}")
         except Exception as e:
             logger.error(f"❌ Error mendaftarkan route {module_name}: {e}")
     
@@ -62,6 +77,9 @@ def register_routes(app: FastAPI) -> None:
     else:
         logger.info("📋 Tidak ada routes tambahan yang terdaftar")
 
+# Hasil discovery get_available_routes, diisi saat pertama kali dipanggil
+_AVAILABLE_ROUTES: Optional[Tuple[str, ...]] = None
+
 def get_available_routes() -> List[str]:
     """
     Mendapatkan daftar routes yang tersedia
@@ -69,16 +87,13 @@ def get_available_routes() -> List[str]:
     Returns:
         List nama routes yang tersedia
     """
-    
-    routes_dir = os.path.dirname(__file__)
-    available_routes = []
-    
-    for file in os.listdir(routes_dir):
-        if file.endswith('.py') and file != '__init__.py':
-            route_name = file[:-3]  # Remove .py extension
-            available_routes.append(route_name)
-    
-    return available_routes
+    global _AVAILABLE_ROUTES
+    if _AVAILABLE_ROUTES is None:
+        # pkgutil memakai finder import yang sudah ada (dan cache-nya), bukan os.listdir
+        _AVAILABLE_ROUTES = tuple(
+            module.name for module in pkgutil.iter_modules(__path__) if not module.ispkg
+        )
+    return list(_AVAILABLE_ROUTES)
 
 # Export fungsi utama
 __all__ = ['register_routes', 'get_available_routes']
@@ -1,22 +1,27 @@
 import os
 import sys
 import logging
-import asyncio
-from datetime import datetime
+import time
+import hashlib
+from time import perf_counter_ns
+from contextlib import asynccontextmanager
 from typing import List, Optional
 
 # FastAPI imports
 from fastapi import FastAPI, Depends, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, Response
 from fastapi.staticfiles import StaticFiles
+import orjson
 
 # Uvicorn untuk server
 import uvicorn
-from uvicorn.config import Config
 
 # Import konfigurasi lokal
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from env_loader import get_env_list
+from utils.helpers.date.formatter import iso_now
+
 try:
     from config.settings.base import *
 except ImportError:
@@ -38,52 +43,82 @@ except ImportError:
         logger.addHandler(handler)
         return logger
 
+# Origin CORS yang diizinkan (comma-separated), bukan wildcard
+CORS_ORIGINS = get_env_list('CORS_ORIGINS', ['http://localhost:3000'])
+
 # Setup logging
 logger = setup_logger(__name__)
 
+# Lifespan: routes didaftarkan saat worker start, bukan saat modul di-import
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    logger.info("=== BK API Server Starting ===")
+    logger.info(f"Debug mode: {DEBUG}")
+    logger.info(f"Base directory: {BASE_DIR}")
+    
+    # Import dan register routes
+    try:
+        from routes import register_routes
+        register_routes(app)
+        logger.info("Routes berhasil didaftarkan")
+    except ImportError as e:
+        logger.warning(f"Routes tidak dapat dimuat: {e}")
+        logger.info("Server akan berjalan tanpa routes tambahan")
+    
+    logger.info("Server siap menerima request")
+    yield
+    logger.info("=== BK API Server Shutting Down ===")
+
 # Inisialisasi FastAPI app
 app = FastAPI(
     title="BK API Server",
     description="Backend API untuk aplikasi BK",
     version="1.0.0",
-    debug=DEBUG
-)
-
-# CORS middleware
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],  # Sesuaikan dengan domain yang diizinkan
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    debug=DEBUG,
+    lifespan=lifespan
 )
 
 # Middleware untuk logging request
 @app.middleware("http")
 async def log_requests(request: Request, call_next):
-    start_time = datetime.utcnow()
-    
-    # Log request
-    logger.info(f"Request: {request.method} {request.url}")
+    # Level dicek per request (murah, di-cache oleh logging) agar perubahan level saat runtime tetap berlaku
+    if not logger.isEnabledFor(logging.INFO):
+        return await call_next(request)
     
-    # Process request
+    start_ns = perf_counter_ns()
     response = await call_next(request)
     
-    # Log response time
-    process_time = (datetime.utcnow() - start_time).total_seconds()
-    logger.info(f"Response: {response.status_code} - Time: {process_time:.3f}s")
+    # Satu baris log per request: method, path, status, waktu proses
+    logger.info(
+        "Request: %s %s - Response: %s - Time: %.3fs",
+        request.method, request.url.path, response.status_code, (perf_counter_ns() - start_ns) / 1e9
+    )
     
     return response
 
+# CORS middleware
+# Ditambahkan setelah log_requests sehingga menjadi lapisan terluar:
+# preflight OPTIONS dijawab langsung tanpa melewati logging
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=CORS_ORIGINS,
+    allow_credentials=True,
+    allow_methods=["*"],
+    allow_headers=["*"],
+)
+
 # Health check endpoint
+# Body statis (tanpa timestamp) di-encode sekali; probe dengan If-None-Match cukup dijawab 304
+_HEALTH_BODY = orjson.dumps({"status": "healthy", "version": "1.0.0"})
+_HEALTH_ETAG = '"' + hashlib.md5(_HEALTH_BODY, usedforsecurity=False).hexdigest() + '"'
+_HEALTH_HEADERS = {"ETag": _HEALTH_ETAG, "Cache-Control": "max-age=1"}
+
 @app.get("/health")
-async def health_check():
+async def health_check(request: Request):
     """Endpoint untuk mengecek status server"""
-    return {
-        "status": "healthy",
-        "timestamp": datetime.utcnow().isoformat(),
-        "version": "1.0.0"
-    }
+    if request.headers.get("if-none-match") == _HEALTH_ETAG:
+        return Response(status_code=304, headers=_HEALTH_HEADERS)
+    return Response(content=_HEALTH_BODY, media_type="application/json", headers=_HEALTH_HEADERS)
 
 # Root endpoint
 @app.get("/")
@@ -91,7 +126,7 @@ async def root():
     """Root endpoint"""
     return {
         "message": "BK API Server berjalan dengan baik",
-        "timestamp": datetime.utcnow().isoformat(),
+        "timestamp": iso_now(),
         "endpoints": {
             "health": "/health",
             "docs": "/docs",
@@ -99,56 +134,35 @@ async def root():
         }
     }
 
-# Import dan register routes
-try:
-    from routes import register_routes
-    register_routes(app)
-    logger.info("Routes berhasil didaftarkan")
-except ImportError as e:
-    logger.warning(f"Routes tidak dapat dimuat: {e}")
-    logger.info("Server akan berjalan tanpa routes tambahan")
-
 # Exception handler
 @app.exception_handler(HTTPException)
 async def http_exception_handler(request: Request, exc: HTTPException):
-    logger.error(f"HTTP Exception: {exc.status_code} - {exc.detail}")
-    return JSONResponse(
+    logger.error("HTTP Exception: %s - %s", exc.status_code, exc.detail)
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={
             "error": True,
             "message": exc.detail,
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": iso_now()
         }
     )
 
 @app.exception_handler(Exception)
 async def general_exception_handler(request: Request, exc: Exception):
-    logger.error(f"Unhandled exception: {str(exc)}")
-    return JSONResponse(
+    # logger.exception: format ditunda sampai benar-benar di-emit, plus traceback
+    logger.exception("Unhandled exception: %s", exc)
+    return ORJSONResponse(
         status_code=500,
         content={
             "error": True,
             "message": "Internal server error",
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": iso_now()
         }
     )
 
-# Startup event
-@app.on_event("startup")
-async def startup_event():
-    logger.info("=== BK API Server Starting ===")
-    logger.info(f"Debug mode: {DEBUG}")
-    logger.info(f"Base directory: {BASE_DIR}")
-    logger.info("Server siap menerima request")
-
-# Shutdown event
-@app.on_event("shutdown")
-async def shutdown_event():
-    logger.info("=== BK API Server Shutting Down ===")
-
 if __name__ == "__main__":
     # Informasi startup
-    current_time = datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")
+    current_time = time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime())
     current_user = os.getenv("USER", "system")
     
     print(f"\n=== BK API Server ===")
@@ -166,9 +180,12 @@ if __name__ == "__main__":
         "./utils"
     ]
     
+    # Cek keberadaan direktori sekali saja, dipakai untuk output dan konfigurasi reload
+    watch_dirs = [d for d in reload_dirs if os.path.isdir(d)]
+    
     print("\n🔍 Monitoring Direktori:")
     for dir_path in reload_dirs:
-        if os.path.exists(dir_path):
+        if dir_path in watch_dirs:
             print(f"   ✅ {dir_path}")
         else:
             print(f"   ❌ {dir_path} (tidak ditemukan)")
@@ -186,21 +203,23 @@ if __name__ == "__main__":
     print("├── Health Check: http://localhost:8000/health")
     print("└── Root: http://localhost:8000/")
     
-    # Konfigurasi uvicorn
-    config = Config(
-        app="server:app",
-        host="0.0.0.0",
-        port=8000,
-        reload=True,
-        reload_dirs=[d for d in reload_dirs if os.path.exists(d)],
-        log_level="info",
-        access_log=True
-    )
-    
     # Jalankan server
+    # uvicorn.run memilih loop/parser terbaik (uvloop, httptools dari uvicorn[standard])
+    # dan menjalankan supervisor reload yang sebenarnya
     try:
-        server = uvicorn.Server(config)
-        asyncio.run(server.serve())
+        uvicorn.run(
+            "server:app",
+            host="0.0.0.0",
+            port=8000,
+            reload=True,
+            reload_dirs=watch_dirs,
+            # Watcher hanya memantau source Python
+            reload_includes=["*.py"],
+            reload_excludes=["*.pyc", "__pycache__", "*.log", ".git/*"],
+            log_level="info",
+            # Access log uvicorn duplikat dengan middleware log_requests
+            access_log=False
+        )
     except KeyboardInterrupt:
         print("\n\n🛑 Server dihentikan oleh user")
     except Exception as e:
@@ -7,16 +7,21 @@ Server FastAPI yang bersih tanpa dependencies kompleks
 import os
 import sys
 import logging
-import asyncio
-from datetime import datetime
+import time
+from time import perf_counter_ns
 from typing import Optional
 
 # FastAPI imports
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, Response
+import orjson
+import hashlib
 import uvicorn
 
+from env_loader import get_env_list
+from utils.helpers.date.formatter import iso_now
+
 # Setup logging sederhana
 logging.basicConfig(
     level=logging.INFO,
@@ -29,51 +34,58 @@ DEBUG = os.getenv('DEBUG', 'True').lower() == 'true'
 HOST = os.getenv('HOST', '0.0.0.0')
 PORT = int(os.getenv('PORT', 8000))
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+CORS_ORIGINS = get_env_list('CORS_ORIGINS', ['http://localhost:3000'])
 
 # Inisialisasi FastAPI app
 app = FastAPI(
     title="BK API Server",
     description="Backend API untuk aplikasi BK - Versi Sederhana",
     version="1.0.0",
-    debug=DEBUG
-)
-
-# CORS middleware
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    debug=DEBUG,
+    default_response_class=ORJSONResponse
 )
 
 # Middleware untuk logging request
 @app.middleware("http")
 async def log_requests(request: Request, call_next):
-    start_time = datetime.utcnow()
-    
-    # Log request
-    logger.info(f"📥 {request.method} {request.url}")
+    # Level dicek per request (murah, di-cache oleh logging) agar perubahan level saat runtime tetap berlaku
+    if not logger.isEnabledFor(logging.INFO):
+        return await call_next(request)
     
-    # Process request
+    start_ns = perf_counter_ns()
     response = await call_next(request)
     
-    # Log response time
-    process_time = (datetime.utcnow() - start_time).total_seconds()
-    logger.info(f"📤 {response.status_code} - ⏱️  {process_time:.3f}s")
+    # Satu baris log per request: method, path, status, waktu proses
+    logger.info(
+        "📥 %s %s - 📤 %s - ⏱️  %.3fs",
+        request.method, request.url.path, response.status_code, (perf_counter_ns() - start_ns) / 1e9
+    )
     
     return response
 
+# CORS middleware
+# Ditambahkan setelah log_requests sehingga menjadi lapisan terluar:
+# preflight OPTIONS dijawab langsung tanpa melewati logging
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=CORS_ORIGINS,
+    allow_credentials=True,
+    allow_methods=["*"],
+    allow_headers=["*"],
+)
+
 # Health check endpoint
+# Body statis (tanpa timestamp) di-encode sekali; probe dengan If-None-Match cukup dijawab 304
+_HEALTH_BODY = orjson.dumps({"status": "healthy", "version": "1.0.0", "server": "BK API Server"})
+_HEALTH_ETAG = '"' + hashlib.md5(_HEALTH_BODY, usedforsecurity=False).hexdigest() + '"'
+_HEALTH_HEADERS = {"ETag": _HEALTH_ETAG, "Cache-Control": "max-age=1"}
+
 @app.get("/health")
-async def health_check():
+async def health_check(request: Request):
     """Endpoint untuk mengecek status server"""
-    return {
-        "status": "healthy",
-        "timestamp": datetime.utcnow().isoformat(),
-        "version": "1.0.0",
-        "server": "BK API Server"
-    }
+    if request.headers.get("if-none-match") == _HEALTH_ETAG:
+        return Response(status_code=304, headers=_HEALTH_HEADERS)
+    return Response(content=_HEALTH_BODY, media_type="application/json", headers=_HEALTH_HEADERS)
 
 # Root endpoint
 @app.get("/")
@@ -81,7 +93,7 @@ async def root():
     """Root endpoint"""
     return {
         "message": "🚀 BK API Server berjalan dengan baik!",
-        "timestamp": datetime.utcnow().isoformat(),
+        "timestamp": iso_now(),
         "debug_mode": DEBUG,
         "endpoints": {
             "health": "/health",
@@ -91,24 +103,27 @@ async def root():
     }
 
 # API Info endpoint
+# Payload statis, jadi cukup di-serialize sekali saat startup
+_API_INFO_BYTES = orjson.dumps({
+    "name": "BK API Server",
+    "version": "1.0.0",
+    "description": "Backend API untuk aplikasi BK",
+    "debug": DEBUG,
+    "base_dir": BASE_DIR,
+    "python_version": sys.version,
+    "available_endpoints": [
+        {"path": "/", "method": "GET", "description": "Root endpoint"},
+        {"path": "/health", "method": "GET", "description": "Health check"},
+        {"path": "/api/info", "method": "GET", "description": "API information"},
+        {"path": "/docs", "method": "GET", "description": "API documentation"},
+        {"path": "/redoc", "method": "GET", "description": "ReDoc documentation"}
+    ]
+})
+
 @app.get("/api/info")
 async def api_info():
     """Informasi API"""
-    return {
-        "name": "BK API Server",
-        "version": "1.0.0",
-        "description": "Backend API untuk aplikasi BK",
-        "debug": DEBUG,
-        "base_dir": BASE_DIR,
-        "python_version": sys.version,
-        "available_endpoints": [
-            {"path": "/", "method": "GET", "description": "Root endpoint"},
-            {"path": "/health", "method": "GET", "description": "Health check"},
-            {"path": "/api/info", "method": "GET", "description": "API information"},
-            {"path": "/docs", "method": "GET", "description": "API documentation"},
-            {"path": "/redoc", "method": "GET", "description": "ReDoc documentation"}
-        ]
-    }
+    return Response(content=_API_INFO_BYTES, media_type="application/json")
 
 # Test endpoint untuk PPOB
 @app.get("/api/ppob/test")
@@ -116,7 +131,7 @@ async def ppob_test():
     """Test endpoint untuk PPOB"""
     return {
         "message": "PPOB endpoint test berhasil",
-        "timestamp": datetime.utcnow().isoformat(),
+        "timestamp": iso_now(),
         "status": "ready"
     }
 
@@ -126,20 +141,21 @@ async def payment_test():
     """Test endpoint untuk payment"""
     return {
         "message": "Payment endpoint test berhasil",
-        "timestamp": datetime.utcnow().isoformat(),
+        "timestamp": iso_now(),
         "status": "ready"
     }
 
 # Exception handlers
 @app.exception_handler(Exception)
 async def general_exception_handler(request: Request, exc: Exception):
-    logger.error(f"❌ Unhandled exception: {str(exc)}")
-    return JSONResponse(
+    # logger.exception: format ditunda sampai benar-benar di-emit, plus traceback
+    logger.exception("❌ Unhandled exception: %s", exc)
+    return ORJSONResponse(
         status_code=500,
         content={
             "error": True,
             "message": "Internal server error",
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": iso_now()
         }
     )
 
@@ -149,7 +165,7 @@ async def general_exception_handler(request: Request, exc: Exception):
 
 if __name__ == "__main__":
     # Informasi startup
-    current_time = datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")
+    current_time = time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime())
     current_user = os.getenv("USER", "system")
     
     print(f"\n🚀 === BK API Server ===")
@@ -28,7 +28,8 @@ def test_configuration_system():
             config_context,
             ApplicationConfig,
             SchemaValidator,
-            MemoryCache
+            MemoryCache,
+            ConfigLoadError
         )
         
         print("✅ All imports successful")
@@ -96,6 +97,134 @@ def test_configuration_system():
         print(f"✅ Validation passed: {validation_passed}")
         print(f"⚠️  Validation warnings: {validation_failed}")
         
+        # Test 9: Dotted access sees in-place nested changes
+        print("\n📋 Test 9: Dotted Key Access")
+        app_config.set('nested_probe', {'host': 'a', 'port': 1})
+        assert app_config.get('nested_probe.port') == 1
+        app_config.get('nested_probe')['host'] = 'b'
+        assert app_config.get('nested_probe.host') == 'b'
+        app_config.remove_key('nested_probe')
+        print("✅ Dotted get reflects nested changes")
+        
+        # Test 10: Invalid defaults fail the load
+        print("\n📋 Test 10: Default Value Validation")
+        strict_config = ApplicationConfig(validator=SchemaValidator({'port': {'type': int, 'min': 1, 'max': 10}}))
+        try:
+            strict_config.load()
+        except ConfigLoadError:
+            pass
+        else:
+            raise AssertionError("invalid default 'port' was loaded without error")
+        assert not strict_config.is_loaded()
+        print("✅ Invalid defaults raise ConfigLoadError")
+        
+        # Test 11: get_config_value reads live values (no stale value cache)
+        print("\n📋 Test 11: Config Value Lookups")
+        from config import config_manager, ConfigStrategy, BaseConfig
+        
+        class ProbeConfig(BaseConfig):
+            CONFIG_NAME = 'probe'
+            
+            def get_default_values(self):
+                return {'mode': 'a'}
+        
+        probe = ProbeConfig()
+        config_manager.register_config('probe', probe)
+        probe.set('nested', {'host': 'a'})
+        assert get_config_value('probe', 'nested.host') == 'a'
+        probe.get('nested')['host'] = 'b'
+        assert get_config_value('probe', 'nested.host') == 'b'
+        set_config_value('probe', 'mode', 'c')
+        assert get_config_value('probe', 'mode') == 'c'
+        assert get_config_value('probe', 'missing', 'fallback') == 'fallback'
+        config_manager.remove_config('probe')
+        print("✅ Lookups see in-place and set() changes")
+        
+        # Test 12: Lazy strategy loads on access through an earlier get_config reference
+        print("\n📋 Test 12: Lazy Loading Strategy")
+        get_config_ref = config_manager.get_config
+        original_strategy = config_manager.get_loading_strategy()
+        try:
+            config_manager.set_loading_strategy(ConfigStrategy.EAGER)
+            config_manager.set_loading_strategy(ConfigStrategy.LAZY)
+            lazy_probe = ProbeConfig()
+            config_manager.register_config('probe', lazy_probe, auto_load=False)
+            assert not lazy_probe.is_loaded()
+            assert get_config_ref('probe') is lazy_probe
+            assert lazy_probe.is_loaded() and lazy_probe.get('mode') == 'a'
+        finally:
+            config_manager.set_loading_strategy(original_strategy)
+            config_manager.remove_config('probe')
+        print("✅ Lazy configs load on first access")
+        
+        # Test 13: Parsed-file cache returns fresh copies and follows file changes
+        print("\n📋 Test 13: Parsed File Cache")
+        import tempfile
+        from config import FileLoader
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            yaml_file = os.path.join(tmp_dir, 'probe.yaml')
+            with open(yaml_file, 'w') as f:
+                f.write("db:\n  host: a\n")
+            loader = FileLoader()
+            first = loader.load(yaml_file)
+            first['db']['host'] = 'mutated'
+            assert loader.load(yaml_file) == {'db': {'host': 'a'}}
+            with open(yaml_file, 'w') as f:
+                f.write("db:\n  host: changed\n")
+            os.utime(yaml_file, ns=(0, os.stat(yaml_file).st_mtime_ns + 1_000_000))
+            assert loader.load(yaml_file) == {'db': {'host': 'changed'}}
+        print("✅ Cached files are copied and reparsed on change")
+        
+        # Test 14: Environment snapshot is refreshed by reload_env()
+        print("\n📋 Test 14: Environment Snapshot")
+        from config import EnvironmentLoader, reload_env
+        env_loader_probe = EnvironmentLoader('BKTEST_')
+        os.environ['BKTEST_FLAG'] = 'true'
+        reload_env()
+        assert env_loader_probe.load('env') == {'flag': True}
+        os.environ['BKTEST_FLAG'] = '42'
+        assert env_loader_probe.load('env') == {'flag': True}
+        reload_env()
+        assert env_loader_probe.load('env') == {'flag': 42}
+        del os.environ['BKTEST_FLAG']
+        reload_env()
+        print("✅ reload_env() picks up environment changes")
+        
+        # Test 15: env_loader value parsing
+        print("\n📋 Test 15: Env Loader Parsing")
+        try:
+            import env_loader
+        except ImportError as e:
+            print(f"⚠️  Skipped, env_loader unavailable: {e}")
+        else:
+            for token in ('true', 'TRUE', '1', 'yes', 'on', 't', 'y'):
+                assert env_loader._to_bool(token, False) is True
+            for token in ('false', '0', 'no', 'Off', 'f', 'n'):
+                assert env_loader._to_bool(token, True) is False
+            assert env_loader._to_bool('maybe', True) is True
+            assert env_loader._to_list('a, ,b,,"c"', []) == ['a', 'b', 'c']
+            assert env_loader._to_list('["x", "y"]', []) == ['x', 'y']
+            default = ['d']
+            parsed = env_loader._to_list('', default)
+            assert parsed == default and parsed is not default
+            print("✅ Boolean tokens and list items parsed")
+        
+        # Test 16: /health ETag
+        print("\n📋 Test 16: Health ETag")
+        try:
+            from fastapi.testclient import TestClient
+            import server_simple
+        except ImportError as e:
+            print(f"⚠️  Skipped, server dependencies unavailable: {e}")
+        else:
+            client = TestClient(server_simple.app)
+            response = client.get('/health')
+            etag = response.headers['etag']
+            assert response.status_code == 200 and response.json()['status'] == 'healthy'
+            cached = client.get('/health', headers={'If-None-Match': etag})
+            assert cached.status_code == 304 and cached.headers['etag'] == etag
+            print("✅ /health answers 304 for a matching ETag")
+        
         print("\n" + "=" * 60)
         print("🎉 All tests completed successfully!")
         print("✅ Configuration system is working properly")
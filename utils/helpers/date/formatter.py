@@ -1 +1,13 @@
 # formatter.py
+import time
+
+# (detik epoch, string ISO) terakhir; di-cache karena dipanggil di setiap response
+_TS_CACHE = [0, ""]
+
+def iso_now() -> str:
+    """Timestamp UTC saat ini dalam format ISO, di-cache per detik"""
+    now = int(time.time())
+    if now != _TS_CACHE[0]:
+        _TS_CACHE[1] = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(now))
+        _TS_CACHE[0] = now
+    return _TS_CACHE[1]